@@ -1,8 +1,34 @@
+import importlib
+import os
+from contextlib import nullcontext
+
 import streamlit as st
 
-from src.modules.basic_operations import run_basic_operations_module
-from src.modules.energy_power_signals import run_energy_power_module
-from src.modules.signals import run_signals_module
+from src.ui.performance import render_performance_panel
+from src.utils.precision import DEFAULT_PRECISION, PRECISIONS
+from src.utils.profiling import PROFILE_LOG_ENV, Recorder
+
+# Sidebar label -> (module, entry point). A page module is imported the first
+# time it is selected, so a cold start only pays for the page on screen.
+PAGES = {
+    "Signal Fundamentals": ("src.modules.signals", "run_signals_module"),
+    "Basic Signal Operations": (
+        "src.modules.basic_operations",
+        "run_basic_operations_module",
+    ),
+    "Energy and Power Signals": (
+        "src.modules.energy_power_signals",
+        "run_energy_power_module",
+    ),
+    "Convolution": ("src.modules.convolution", "run_convolution_module"),
+    "Oscilloscope": ("src.modules.oscilloscope", "run_oscilloscope_module"),
+}
+
+
+def run_page(label):
+    module_name, entry_point = PAGES[label]
+    getattr(importlib.import_module(module_name), entry_point)()
+
 
 st.set_page_config(layout="wide", page_title="CS Viz", menu_items={})
 
@@ -25,16 +51,7 @@ st.markdown(
 st.sidebar.markdown("## Comm. Systems Visualizer")
 st.sidebar.markdown("---")
 
-signal_topic = st.sidebar.radio(
-    "Signal Analysis",
-    [
-        "Signal Fundamentals",
-        "Basic Signal Operations",
-        "Energy and Power Signals",
-        "Convolution",
-    ],
-    key="signal_analysis",
-)
+signal_topic = st.sidebar.radio("Signal Analysis", list(PAGES), key="signal_analysis")
 digital_comm_topic = st.sidebar.radio(
     "Digital Communication",
     [
@@ -43,9 +60,31 @@ digital_comm_topic = st.sidebar.radio(
     key="digital_comm",
 )
 
-if signal_topic == "Signal Fundamentals":
-    run_signals_module()
-if signal_topic == "Basic Signal Operations":
-    run_basic_operations_module()
-if signal_topic == "Energy and Power Signals":
-    run_energy_power_module()
+st.sidebar.markdown("---")
+st.sidebar.selectbox(
+    "Sample Precision",
+    list(PRECISIONS),
+    index=list(PRECISIONS).index(DEFAULT_PRECISION),
+    key="precision",
+    help="float32 halves memory and plot size; energy and power still "
+    "accumulate in float64",
+)
+show_performance = st.sidebar.toggle(
+    "Profile Reruns",
+    key="profiling",
+    help="Time, memory and array size per stage of each rerun "
+    "(memory tracing slows reruns down)",
+)
+
+# Reruns are recorded when the panel is shown or a log file is configured
+profile_log = os.environ.get(PROFILE_LOG_ENV)
+recorder = Recorder(signal_topic) if show_performance or profile_log else None
+
+with recorder or nullcontext():
+    run_page(signal_topic)
+
+if recorder is not None:
+    if profile_log:
+        recorder.export(profile_log)
+    if show_performance:
+        render_performance_panel(recorder)
@@ -0,0 +1,63 @@
+"""
+Closed-form energy vs numeric integration for every registry signal.
+Times the two paths and cross-checks them at a finer step than the tests
+(exit status 1 on disagreement). tests/test_energy.py enforces the closed
+forms and holds the signal parameters and transforms used here.
+
+Run from the repository root:
+    python -m benchmarks.bench_analytic_energy
+"""
+
+import sys
+import time
+
+from src.core.signals import SIGNAL_REGISTRY
+from src.utils.time_axis import TimeAxis
+from tests.test_energy import FACTORY_ARGS, TRANSFORMS
+
+# Window and resolution of the numeric reference
+TIME_AXIS = TimeAxis(t_min=-5.0, t_max=5.0, dt=1e-5)
+
+# Trapezoid error on discontinuous signals is O(dt)
+RELATIVE_TOLERANCE = 1e-3
+ABSOLUTE_TOLERANCE = 1e-4
+
+
+def main():
+    t = TIME_AXIS.lazy()
+    failures = 0
+
+    # Warm up lazy imports (scipy.special for sinc)
+    SIGNAL_REGISTRY["sinc"]().analytic_energy(0.0, 1.0)
+
+    print(
+        f"{'signal':>12} {'transform':>9} {'analytic':>14} {'numeric':>14} {'speedup':>9}"
+    )
+    for key, factory in SIGNAL_REGISTRY.items():
+        for label, transform in TRANSFORMS.items():
+            signal = transform(factory(**FACTORY_ARGS.get(key, {})))
+
+            start = time.perf_counter()
+            exact = signal.analytic_energy(t[0], t[-1])
+            analytic_s = time.perf_counter() - start
+            if exact is None:
+                continue  # no closed form (numeric path only)
+
+            start = time.perf_counter()
+            numeric = signal.energy(t, analytic=False)
+            numeric_s = time.perf_counter() - start
+
+            ok = abs(exact - numeric) <= max(
+                RELATIVE_TOLERANCE * abs(numeric), ABSOLUTE_TOLERANCE
+            )
+            failures += not ok
+            print(
+                f"{key:>12} {label:>9} {exact:>14.6f} {numeric:>14.6f} "
+                f"{numeric_s / analytic_s:>8.0f}x{'' if ok else '  MISMATCH'}"
+            )
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
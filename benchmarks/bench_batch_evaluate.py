@@ -0,0 +1,61 @@
+"""
+Batched parameter sweeps vs one evaluate() call per parameter set.
+Checks that both give identical rows (exit status 1 otherwise).
+
+Run from the repository root:
+    python -m benchmarks.bench_batch_evaluate
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from src.core.batch import evaluate_batch
+from src.core.signals import sinusoid
+
+N_PARAMS = 1000
+SAMPLE_COUNTS = (100, 1_000, 10_000)
+
+
+def main():
+    frequencies = np.linspace(1.0, 100.0, N_PARAMS)
+    base = sinusoid(amplitude=1.0, frequency=1.0, phase=0.2).time_shift(0.1)
+    failures = 0
+
+    print(f"{'samples':>8} {'loop s':>9} {'batch s':>9} {'tiled s':>9} {'speedup':>8}")
+    for n in SAMPLE_COUNTS:
+        t = np.linspace(-1.0, 1.0, n)
+
+        start = time.perf_counter()
+        looped = np.stack(
+            [
+                sinusoid(amplitude=1.0, frequency=f, phase=0.2)
+                .time_shift(0.1)
+                .evaluate(t)
+                for f in frequencies
+            ]
+        )
+        loop_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = evaluate_batch(base, t, {"frequency": frequencies})
+        batch_s = time.perf_counter() - start
+
+        # ~1 MiB tiles: many tiles even for the smallest grid
+        start = time.perf_counter()
+        tiled = evaluate_batch(base, t, {"frequency": frequencies}, tile_bytes=1024**2)
+        tiled_s = time.perf_counter() - start
+
+        ok = np.array_equal(looped, batched) and np.array_equal(batched, tiled)
+        failures += not ok
+        print(
+            f"{n:>8,} {loop_s:>9.4f} {batch_s:>9.4f} {tiled_s:>9.4f} "
+            f"{loop_s / batch_s:>7.1f}x{'' if ok else '  MISMATCH'}"
+        )
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
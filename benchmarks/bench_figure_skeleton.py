@@ -0,0 +1,139 @@
+"""
+Figure construction: fully validated go.Figure per call vs cached skeleton.
+
+The legacy builder is plot_signal's previous body (new Figure, add_trace,
+full update_layout with the template lookup). Both produce the same JSON,
+checked for every style; exits 1 on a mismatch.
+
+Run from the repository root:
+    python -m benchmarks.bench_figure_skeleton
+"""
+
+import json
+import sys
+import timeit
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from src.ui.plots import plot_signal, stem_coordinates
+
+POINT_COUNTS = (100, 2_400, 20_000)  # 2 400 = downsampling target at 1200 px
+REPEAT = 20
+
+STYLES = {
+    "continuous": {"discrete": False},
+    "discrete": {"discrete": True},
+    "fixed limits": {"autoscale": False, "xlim": (-2, 2), "ylim": (-1.5, 1.5)},
+}
+
+
+# Legacy figure (validated on every call)
+# -----------------------------------------------------------------------
+def _axis(axis_range):
+    return dict(
+        range=axis_range,
+        showline=True,
+        linewidth=1,
+        showgrid=True,
+        gridcolor="lightgray",
+        gridwidth=1,
+        zeroline=False,
+        zerolinecolor="red",
+        zerolinewidth=1,
+    )
+
+
+def legacy_plot(
+    t, x, title="Signal", discrete=False, autoscale=True, xlim=None, ylim=None
+):
+    fig = go.Figure()
+    if discrete:
+        stem_x, stem_y = stem_coordinates(t, x)
+        fig.add_trace(
+            go.Scatter(
+                x=stem_x,
+                y=stem_y,
+                mode="lines",
+                line=dict(color="blue", width=2),
+                connectgaps=False,
+                hoverinfo="skip",
+                showlegend=False,
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=t,
+                y=x,
+                mode="markers",
+                marker=dict(color="blue", size=8),
+                showlegend=False,
+            )
+        )
+    else:
+        fig.add_trace(
+            go.Scatter(
+                x=t, y=x, mode="lines", name="Signal", line=dict(color="blue", width=2)
+            )
+        )
+
+    if autoscale:
+        dx = (np.max(t) - np.min(t)) * 0.05
+        dy = (np.max(x) - np.min(x)) * 0.05
+        x_range = [np.min(t) - dx, np.max(t) + dx]
+        y_range = [np.min(x) - dy, np.max(x) + dy]
+    else:
+        x_range, y_range = list(xlim), list(ylim)
+
+    fig.update_layout(
+        title=title,
+        xaxis_title="Time",
+        yaxis_title="Amplitude",
+        template="plotly_white",
+        height=400,
+        margin=dict(l=10, r=10, t=40, b=40),
+        xaxis=_axis(x_range),
+        yaxis=_axis(y_range),
+    )
+    return fig
+
+
+def spec(fig):
+    return json.loads(pio.to_json(fig, validate=False))
+
+
+def main():
+    ok = True
+    print(
+        f"{'points':>8} {'style':>13} {'legacy ms':>10} {'skeleton ms':>12} {'speedup':>8}"
+    )
+    for n in POINT_COUNTS:
+        t = np.linspace(-5.0, 5.0, n)
+        x = np.sin(2 * np.pi * 0.5 * t)
+        for style, options in STYLES.items():
+            options = dict(options, title=f"{style} ({n})")
+
+            def legacy(options=options, t=t, x=x):
+                return legacy_plot(t, x, **options)
+
+            def skeleton(options=options, t=t, x=x):
+                return plot_signal(t, x, downsample=None, **options)
+
+            if spec(legacy()) != spec(skeleton()):
+                print(f"MISMATCH: {style} at {n} points")
+                ok = False
+
+            legacy_s = min(timeit.repeat(legacy, number=1, repeat=REPEAT))
+            skeleton_s = min(timeit.repeat(skeleton, number=1, repeat=REPEAT))
+            print(
+                f"{n:>8,} {style:>13} {legacy_s * 1e3:>10.2f} {skeleton_s * 1e3:>12.2f} "
+                f"{legacy_s / skeleton_s:>7.1f}x"
+            )
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
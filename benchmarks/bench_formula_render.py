@@ -0,0 +1,47 @@
+"""
+Building and titling composite signals: time per leaf should stay flat as
+the tree grows (linear total cost).
+
+Run from the repository root:
+    python -m benchmarks.bench_formula_render
+"""
+
+import time
+
+from src.core.signals import rectangular_pulse, sinusoid
+
+CHAIN_LENGTHS = (100, 1_000, 10_000)
+
+
+def build_chain(n_leaves):
+    """Left-deep sum, the shape repeated `+` produces"""
+    signal = sinusoid(1.0, 1.0, 0.0).time_shift(0.5)
+    for i in range(1, n_leaves):
+        term = rectangular_pulse(-i, i).time_scale(2.0)
+        signal = (signal + term) if i % 2 else (signal * term.fold())
+    return signal
+
+
+def main():
+    print(
+        f"{'leaves':>7} {'build ms':>9} {'formula ms':>11} {'µs/leaf':>8} "
+        f"{'chars':>10}"
+    )
+    for n_leaves in CHAIN_LENGTHS:
+        start = time.perf_counter()
+        signal = build_chain(n_leaves).time_shift(1.0)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        formula = signal.formula
+        signal.name
+        render_s = time.perf_counter() - start
+
+        print(
+            f"{n_leaves:>7} {build_s * 1e3:>9.2f} {render_s * 1e3:>11.2f} "
+            f"{(build_s + render_s) / n_leaves * 1e6:>8.2f} {len(formula):>10,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
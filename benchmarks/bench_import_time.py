@@ -0,0 +1,91 @@
+"""
+Cold-start import cost, measured with `python -X importtime` in fresh processes.
+
+Page modules are timed on top of streamlit and numpy, which every page
+shares, so the numbers are what selecting that page adds. "app" is the full
+script start in bare mode: streamlit plus the default page.
+
+Run from the repository root (optional runs per target):
+    python -m benchmarks.bench_import_time [5]
+"""
+
+import statistics
+import subprocess
+import sys
+
+SHARED = "import streamlit, numpy"
+PAGES = (
+    "src.modules.signals",
+    "src.modules.basic_operations",
+    "src.modules.energy_power_signals",
+    "src.modules.convolution",
+    "src.modules.oscilloscope",
+)
+
+# label -> (code run, module timed; None times every top-level import)
+TARGETS = {
+    "streamlit + numpy": (SHARED, None),
+    "app (default page)": ("import app", "app"),
+    **{page: (f"{SHARED}; import {page}", page) for page in PAGES},
+    "src.cli": ("import src.cli", "src.cli"),
+}
+
+# Heavy dependencies that should load on first use, not at start-up
+DEFERRED = ("scipy.signal", "scipy.special", "pandas", "pyarrow")
+
+
+def import_seconds(code, module=None):
+    """Cumulative import time of `module` when a fresh interpreter runs code"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    # "import time: self [us] | cumulative | name", top-level names unindented
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):
+            continue
+        name = name.strip()
+        if module is None or name == module:
+            total += int(cumulative)
+    return total / 1e6
+
+
+def loaded_at_start(modules):
+    """Which of `modules` are already imported after `import app`"""
+    code = (
+        "import sys, app; "
+        f"print(','.join(m for m in {list(modules)!r} if m in sys.modules))"
+    )
+    stdout = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    loaded = stdout.strip().splitlines()[-1] if stdout.strip() else ""
+    return [name for name in loaded.split(",") if name]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print(f"{'target':>34} {'median ms':>10} {'min ms':>8}")
+    for label, (code, module) in TARGETS.items():
+        times = [import_seconds(code, module) for _ in range(runs)]
+        print(
+            f"{label:>34} {statistics.median(times) * 1e3:>10.1f} "
+            f"{min(times) * 1e3:>8.1f}"
+        )
+
+    loaded = loaded_at_start(DEFERRED)
+    print(
+        f"Deferred dependencies loaded by app start-up: {', '.join(loaded) or 'none'}"
+    )
+
+
+if __name__ == "__main__":
+    main()
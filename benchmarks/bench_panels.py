@@ -0,0 +1,66 @@
+"""
+Multi-panel pages: panels run one after another vs on the panel thread pool.
+Each panel evaluates a fresh signal (evaluation cache bypassed), then
+downsamples and builds its figure. The threaded run uses one thread per
+panel, whatever PANEL_EXECUTOR would pick on this machine.
+
+Run from the repository root:
+    python -m benchmarks.bench_panels
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.signals import sinusoid
+from src.ui.panels import Panel, _run_panel, compute_panels
+from src.ui.plots import plot_signal
+from src.utils.time_axis import TimeAxis
+
+TIME_AXIS = TimeAxis(t_min=-5.0, t_max=5.0, dt=1e-5)  # 1M samples
+PANEL_COUNTS = (1, 2, 4, 8)
+REPEATS = 3
+
+
+def make_panels(n_panels, t):
+    panels = []
+    for i in range(n_panels):
+        signal = (sinusoid(1.0, 1.0 + i) * sinusoid(0.5, 40.0 + i)).time_shift(0.1 * i)
+        panels.append(
+            Panel(
+                f"panel{i}",
+                evaluate=lambda signal=signal: (t, signal.evaluate(t)),
+                figure=lambda t, x: plot_signal(t, x),
+            )
+        )
+    return panels
+
+
+def best_of(func):
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    t = TIME_AXIS.generate()
+    plot_signal(t[:10], t[:10])  # warm up Plotly's validators
+
+    print(f"cores: {os.cpu_count()}")
+    print(f"{'panels':>7} {'sequential ms':>14} {'threaded ms':>12} {'speedup':>8}")
+    for n_panels in PANEL_COUNTS:
+        panels = make_panels(n_panels, t)
+        sequential = best_of(lambda: [_run_panel(panel) for panel in panels])
+        with ThreadPoolExecutor(max_workers=n_panels) as pool:
+            threaded = best_of(lambda: compute_panels(panels, executor=pool))
+        print(
+            f"{n_panels:>7} {sequential * 1e3:>14.1f} {threaded * 1e3:>12.1f} "
+            f"{sequential / threaded:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
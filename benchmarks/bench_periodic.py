@@ -0,0 +1,62 @@
+"""
+Periodic signals: evaluate one period and tile, vs evaluating every sample.
+
+Run from the repository root:
+    python -m benchmarks.bench_periodic
+"""
+
+import time
+
+import numpy as np
+
+from src.core.cache import EVALUATION_CACHE
+from src.core.periodic import average_power, periodic
+from src.core.signals import sinusoid, triangular_wave
+from src.utils.time_axis import TimeAxis
+
+WINDOWS = (10.0, 100.0, 1000.0)  # seconds
+FS = 10_000.0
+
+CASES = {
+    "sinusoid 10 Hz": (sinusoid(1.5, 10.0, 0.3), 0.1),
+    "triangle wave": (triangular_wave(0.0, 0.05, 2.0), 0.1),
+}
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(
+        f"{'signal':>15} {'window s':>9} {'samples':>11} {'direct ms':>10} "
+        f"{'tiled ms':>9} {'speedup':>8} {'max |diff|':>11}"
+    )
+    for label, (base, period) in CASES.items():
+        wave = periodic(base, period)
+        # The direct reference wraps time explicitly for the non-periodic base
+        if label.startswith("sinusoid"):
+            direct = base.evaluate
+        else:
+
+            def direct(t, base=base, period=period):
+                return base.evaluate(np.mod(t, period))
+
+        for window in WINDOWS:
+            t = TimeAxis(0.0, window, 1 / FS).generate()
+            EVALUATION_CACHE.clear()
+            direct_s, reference = timed(lambda: direct(t))
+            tiled_s, tiled = timed(lambda: wave.evaluate(t))
+            print(
+                f"{label:>15} {window:>9.0f} {len(t):>11,} {direct_s * 1e3:>10.1f} "
+                f"{tiled_s * 1e3:>9.1f} {direct_s / tiled_s:>7.1f}x "
+                f"{np.max(np.abs(reference - tiled)):>11.1e}"
+            )
+
+        print(f"{'':>15} average power (exact): {average_power(wave):.12f}")
+
+
+if __name__ == "__main__":
+    main()
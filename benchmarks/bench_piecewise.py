@@ -0,0 +1,92 @@
+"""
+Piecewise-polynomial signals: factory equivalence and pulse-train scaling.
+
+Checks that the piecewise forms of unit_step, ramp, rectangular_pulse and
+triangular_wave match the factories (exit status 1 otherwise), then times a
+pulse train against the same pulses summed as rectangular_pulse signals.
+
+Run from the repository root:
+    python -m benchmarks.bench_piecewise
+"""
+
+import sys
+import time
+from functools import reduce
+from operator import add
+
+import numpy as np
+
+from src.core.piecewise import piecewise_polynomial, pulse_train
+from src.core.signals import ramp, rectangular_pulse, triangular_wave, unit_step
+from src.utils.time_axis import TimeAxis
+
+TIME_AXIS = TimeAxis(t_min=-5.0, t_max=5.0, dt=1e-5)  # 1M samples
+SEGMENT_COUNTS = (10, 1_000, 100_000)
+MAX_SUMMED_PULSES = 1_000  # the summed baseline is O(N·K)
+
+START, END, AMPLITUDE = -1.3, 2.1, 2.0
+MID, HALF = (START + END) / 2, (END - START) / 2
+
+EQUIVALENT = {
+    "unit_step": (unit_step(2.0), piecewise_polynomial([0, np.inf], [[2.0]])),
+    "ramp": (ramp(), piecewise_polynomial([0, np.inf], [[1.0], [0.0]])),
+    "rectangular": (
+        rectangular_pulse(START, END, AMPLITUDE),
+        piecewise_polynomial([START, END], [[AMPLITUDE]]),
+    ),
+    "triangular": (
+        triangular_wave(START, END, AMPLITUDE),
+        piecewise_polynomial(
+            [START, MID, END],
+            [[AMPLITUDE / HALF, -AMPLITUDE / HALF], [0.0, AMPLITUDE]],
+        ),
+    ),
+}
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    t = TIME_AXIS.generate()
+    failures = 0
+
+    print(f"{'factory':>12} {'max |diff|':>11} {'energy diff':>12}")
+    for label, (factory, piecewise) in EQUIVALENT.items():
+        diff = np.max(np.abs(factory.evaluate(t) - piecewise.evaluate(t)))
+        energy_diff = abs(
+            factory.analytic_energy(t[0], t[-1])
+            - piecewise.analytic_energy(t[0], t[-1])
+        )
+        ok = diff <= 1e-12 and energy_diff <= 1e-9
+        failures += not ok
+        print(
+            f"{label:>12} {diff:>11.1e} {energy_diff:>12.1e}{'' if ok else '  MISMATCH'}"
+        )
+
+    print(f"\n{'segments':>9} {'train ms':>9} {'summed ms':>10} {'speedup':>8}")
+    for n_segments in SEGMENT_COUNTS:
+        n_pulses = (n_segments + 1) // 2
+        period = 10.0 / n_pulses
+        starts = -5.0 + period * np.arange(n_pulses)
+        width = period / 2
+
+        train_s, _ = timed(lambda: pulse_train(starts, width).evaluate(t))
+
+        if n_pulses <= MAX_SUMMED_PULSES:
+            # Closed pulses [s, s + w], with the open end nudged inward
+            pulses = [rectangular_pulse(s, s + width * (1 - 1e-9)) for s in starts]
+            summed_s, _ = timed(lambda: reduce(add, pulses).evaluate(t))
+            summed = f"{summed_s * 1e3:>10.1f} {summed_s / train_s:>7.0f}x"
+        else:
+            summed = f"{'-':>10} {'-':>8}"
+        print(f"{n_segments:>9,} {train_s * 1e3:>9.1f} {summed}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
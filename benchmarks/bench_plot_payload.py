@@ -0,0 +1,95 @@
+"""
+Figure payload: JSON number lists vs base64 typed arrays (float64 / float32).
+
+plot_signal figures are built without downsampling, so the trace size is
+the point count, then serialized the way st.plotly_chart does (plotly.io.to_json). The
+typed-array payloads are decoded and checked against the source samples;
+exits 1 on a mismatch.
+
+Run from the repository root:
+    python -m benchmarks.bench_plot_payload
+"""
+
+import base64
+import json
+import sys
+import timeit
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from src.ui.plots import plot_signal
+
+POINT_COUNTS = (10_000, 100_000, 1_000_000)
+REPEAT = 3
+
+
+def build(t, x, encoding):
+    if encoding == "json lists":
+        # What plotly < 6 sent for any input: plain number lists
+        fig = plot_signal(t, x, downsample=None)
+        return go.Figure(
+            go.Scatter(fig.data[0], x=t.tolist(), y=x.tolist()), layout=fig.layout
+        )
+    precision = "float32" if encoding == "bdata f4" else None
+    return plot_signal(t, x, downsample=None, precision=precision)
+
+
+def encode(fig):
+    return pio.to_json(fig, validate=False)
+
+
+def decoded(values):
+    """Trace array from its JSON form (typed array spec or number list)"""
+    if isinstance(values, dict):
+        return np.frombuffer(base64.b64decode(values["bdata"]), dtype=values["dtype"])
+    return np.asarray(values, dtype=float)
+
+
+def check(payload, t, x, dtype):
+    trace = json.loads(payload)["data"][0]
+    expected_t, expected_x = t.astype(dtype), x.astype(dtype)
+    return np.array_equal(decoded(trace["x"]), expected_t) and np.array_equal(
+        decoded(trace["y"]), expected_x
+    )
+
+
+def main():
+    ok = True
+    print(
+        f"{'points':>10} {'encoding':>11} {'build ms':>9} {'encode ms':>10} "
+        f"{'payload KB':>11} {'vs lists':>9}"
+    )
+    for n in POINT_COUNTS:
+        t = np.linspace(-5.0, 5.0, n)
+        x = np.sin(2 * np.pi * 3.0 * t) * np.exp(-0.1 * t * t)
+
+        reference_bytes = None
+        for encoding in ("json lists", "bdata f8", "bdata f4"):
+            build_s = min(
+                timeit.repeat(lambda: build(t, x, encoding), number=1, repeat=REPEAT)
+            )
+            fig = build(t, x, encoding)
+            encode_s = min(timeit.repeat(lambda: encode(fig), number=1, repeat=REPEAT))
+            payload = encode(fig)
+
+            if encoding == "json lists":
+                reference_bytes = len(payload)
+            else:
+                dtype = np.float32 if encoding == "bdata f4" else np.float64
+                if not check(payload, t, x, dtype):
+                    print(f"MISMATCH: {encoding} payload at {n} points")
+                    ok = False
+
+            print(
+                f"{n:>10,} {encoding:>11} {build_s * 1e3:>9.1f} {encode_s * 1e3:>10.1f} "
+                f"{len(payload) / 1e3:>11.0f} {reference_bytes / len(payload):>8.1f}x"
+            )
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Memory, speed and accuracy of each sample precision: time axis, evaluation,
+energy and the serialized plot.
+
+Run from the repository root:
+    python -m benchmarks.bench_precision
+"""
+
+import time
+import tracemalloc
+
+import plotly.io as pio
+
+from src.core.signals import sinusoid
+from src.ui.plots import plot_signal
+from src.utils.precision import PRECISIONS
+from src.utils.time_axis import TimeAxis
+
+N_SAMPLES = 2_000_000
+REPEATS = 5
+
+
+def best_of(func, repeats=REPEATS):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def peak_bytes(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    signal = (sinusoid(1.0, 3.0) * sinusoid(0.5, 40.0)).time_shift(0.2)
+    reference = None
+
+    print(
+        f"{'precision':>9} {'samples MB':>10} {'peak MB':>8} {'eval ms':>8} "
+        f"{'energy ms':>9} {'plot KB':>8} {'energy rel err':>14}"
+    )
+    for precision in PRECISIONS:
+        axis = TimeAxis(-5.0, 5.0, 10.0 / N_SAMPLES, precision=precision)
+        t = axis.generate()
+
+        eval_s, x = best_of(lambda: signal.evaluate(t))
+        energy_s, E = best_of(lambda: signal.energy(t, analytic=False))
+        peak = peak_bytes(lambda: signal.evaluate(t))
+        payload = len(pio.to_json(plot_signal(t, x)))
+
+        reference = reference if reference is not None else E
+        print(
+            f"{precision:>9} {(t.nbytes + x.nbytes) / 1e6:>10.1f} {peak / 1e6:>8.1f} "
+            f"{eval_s * 1e3:>8.1f} {energy_s * 1e3:>9.1f} {payload / 1e3:>8.1f} "
+            f"{abs(E - reference) / reference:>14.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
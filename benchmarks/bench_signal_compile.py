@@ -0,0 +1,82 @@
+"""
+Composite signal evaluation: nested lambdas vs compiled expression graph.
+
+Run from the repository root:
+    python -m benchmarks.bench_signal_compile
+"""
+
+import timeit
+
+import numpy as np
+
+from src.core.signals import (
+    Signal,
+    exponential,
+    ramp,
+    rectangular_pulse,
+    sinusoid,
+    triangular_wave,
+    unit_step,
+)
+
+N_SAMPLES = 1_000_000
+REPEAT = 5
+
+
+# Legacy composition (one lambda + evaluate() per node)
+# -----------------------------------------------------------------------
+def legacy_add(a, b):
+    return Signal(lambda t: a.evaluate(t) + b.evaluate(t), "add", "")
+
+
+def legacy_mul(a, b):
+    return Signal(lambda t: a.evaluate(t) * b.evaluate(t), "mul", "")
+
+
+def build_terms():
+    """Ten leaf signals, several sharing the same time transform"""
+    carrier = sinusoid(1.0, 5.0, 0.0).time_shift(0.5)
+    return [
+        carrier,
+        rectangular_pulse(-2.0, 2.0, 1.0).time_shift(0.5),
+        sinusoid(0.5, 2.0, 0.3).time_shift(0.5),
+        triangular_wave(-1.0, 3.0, 2.0),
+        exponential(1.0, -0.5),
+        unit_step(1.0).time_shift(0.5),
+        ramp(),
+        sinusoid(0.2, 9.0, 1.0).time_scale(2.0),
+        carrier,  # repeated subexpression
+        rectangular_pulse(0.0, 4.0, 0.5).time_scale(2.0),
+    ]
+
+
+def compose(terms, add, mul):
+    """((t0*t1 + t2*t3) * ... ) mixes sums and products over 10 terms"""
+    expr = mul(terms[0], terms[1])
+    for i in range(2, len(terms), 2):
+        expr = add(expr, mul(terms[i], terms[i + 1]))
+    return mul(expr, add(terms[0], terms[5]))
+
+
+def main():
+    t = np.linspace(-10.0, 10.0, N_SAMPLES)
+
+    legacy = compose(build_terms(), legacy_add, legacy_mul)
+    compiled = compose(build_terms(), Signal.__add__, Signal.__mul__)
+
+    np.testing.assert_allclose(compiled.evaluate(t), legacy.evaluate(t), rtol=1e-12)
+
+    program = compiled.compile()
+    t_legacy = min(timeit.repeat(lambda: legacy.evaluate(t), number=1, repeat=REPEAT))
+    t_compiled = min(timeit.repeat(lambda: program(t), number=1, repeat=REPEAT))
+
+    print(f"samples            : {N_SAMPLES:,}")
+    print(f"unique leaves      : {program.n_leaves} (of 12 references)")
+    print(f"time chains        : {program.n_chains}")
+    print(f"nested lambdas     : {t_legacy * 1e3:8.2f} ms")
+    print(f"compiled program   : {t_compiled * 1e3:8.2f} ms")
+    print(f"speedup            : {t_legacy / t_compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
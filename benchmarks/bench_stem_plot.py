@@ -0,0 +1,70 @@
+"""
+Discrete-mode stem plots: one trace per sample vs vectorized single trace.
+Reports figure build time and JSON payload size.
+
+Run from the repository root:
+    python -m benchmarks.bench_stem_plot
+"""
+
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+
+from src.ui.plots import plot_signal
+
+SAMPLE_COUNTS = (100, 500, 2_000, 20_000)
+LEGACY_MAX_SAMPLES = 2_000  # one trace per sample gets impractical beyond this
+
+
+def legacy_stem_figure(t, x, color="blue"):
+    """Stem plot as built before the vectorized renderer"""
+    fig = go.Figure()
+    for xi, ti in zip(x, t):
+        fig.add_trace(
+            go.Scatter(
+                x=[ti, ti],
+                y=[0, xi],
+                mode="lines+markers",
+                marker=dict(color=color, size=8),
+                line=dict(color=color, width=2),
+                showlegend=False,
+            )
+        )
+    return fig
+
+
+def measure(build):
+    start = time.perf_counter()
+    fig = build()
+    built = time.perf_counter()
+    payload = fig.to_json()
+    return built - start, time.perf_counter() - built, len(payload)
+
+
+def main():
+    # Warm up plotly's validators so the first row is not skewed
+    plot_signal(np.arange(3.0), np.ones(3), discrete=True).to_json()
+
+    print(
+        f"{'samples':>8} {'renderer':>10} {'build ms':>10} "
+        f"{'json ms':>10} {'payload KiB':>12}"
+    )
+    for n in SAMPLE_COUNTS:
+        t = np.linspace(-5.0, 5.0, n)
+        x = np.sin(2 * np.pi * t)
+
+        runs = [("vectorized", lambda: plot_signal(t, x, discrete=True))]
+        if n <= LEGACY_MAX_SAMPLES:
+            runs.insert(0, ("legacy", lambda: legacy_stem_figure(t, x)))
+
+        for label, build in runs:
+            build_s, json_s, size = measure(build)
+            print(
+                f"{n:>8} {label:>10} {build_s * 1e3:>10.1f} "
+                f"{json_s * 1e3:>10.1f} {size / 1024:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Streaming source: raw block throughput and a paced real-time run.
+
+Run from the repository root (optional run length in seconds):
+    python -m benchmarks.bench_stream [3]
+"""
+
+import sys
+import time
+
+from src.core.signals import rectangular_pulse, sinusoid
+from src.core.stream import SignalStream
+
+SAMPLE_RATES = (50_000, 200_000)
+POLL_INTERVAL = 0.05  # seconds between polls, like a fragment refresh
+WINDOW = 1.0  # seconds of history
+
+SIGNALS = {
+    "sinusoid": sinusoid(1.0, 50.0, 0.0),
+    "am (composite)": (sinusoid(1.0, 5.0) + rectangular_pulse(0, 1e9, 1.0))
+    * sinusoid(1.0, 500.0),
+}
+
+
+class ManualClock:
+    """Clock the benchmark advances itself, to measure raw throughput"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def raw_throughput(signal, fs, seconds=20.0):
+    clock = ManualClock()
+    stream = SignalStream(signal, fs, window=WINDOW, clock=clock)
+    stream.poll()
+    start = time.perf_counter()
+    for step in range(1, int(seconds / POLL_INTERVAL) + 1):
+        clock.now = step * POLL_INTERVAL
+        stream.poll()
+    elapsed = time.perf_counter() - start
+    return stream.blocks * stream.block_size / elapsed
+
+
+def paced_run(signal, fs, duration):
+    stream = SignalStream(signal, fs, window=WINDOW)
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        stream.poll()
+        stream.snapshot()  # what the live view reads every refresh
+        time.sleep(POLL_INTERVAL)
+    stream.poll()
+    return stream
+
+
+def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+
+    print(
+        f"{'signal':>15} {'fs':>8} {'raw MS/s':>9} {'paced S/s':>10} {'dropped':>8} "
+        f"{'late':>5} {'load':>6} {'buffer KB':>10}"
+    )
+    for label, signal in SIGNALS.items():
+        for fs in SAMPLE_RATES:
+            raw = raw_throughput(signal, fs)
+            stream = paced_run(signal, fs, duration)
+            stats = stream.stats()
+            buffer_kb = (stream.buffer.t.nbytes + stream.buffer.x.nbytes) / 1e3
+            print(
+                f"{label:>15} {fs:>8,} {raw / 1e6:>9.1f} {stats['sample_rate']:>10,.0f} "
+                f"{stats['dropped']:>8} {stats['late']:>5} {stats['load']:>6.1%} "
+                f"{buffer_kb:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
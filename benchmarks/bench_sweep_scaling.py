@@ -0,0 +1,64 @@
+"""
+Parallel classification sweep: wall time and speedup per worker count.
+Uses the numeric path (analytic=False) so every case does real work.
+
+Run from the repository root (optionally with explicit worker counts):
+    python -m benchmarks.bench_sweep_scaling [1 2 4 8]
+"""
+
+import os
+import sys
+import time
+
+from src.core.sweep import classify_sweep, expand_job
+from src.utils.time_axis import TimeAxis
+
+TIME_AXIS = TimeAxis(t_min=-5.0, t_max=5.0, dt=1e-4)  # 100k samples
+
+SWEEP = {
+    "signal": "Sinusoidal",
+    "params": {
+        "amplitude": [0.5, 1.0, 2.0, 4.0],
+        "frequency": [0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0],
+    },
+    "transforms": {
+        "shift": [0.0, 0.25, 0.5, 1.0],
+        "scale": [1.0, 2.0],
+        "fold": [False, True],
+    },
+}
+
+
+def worker_counts():
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main():
+    cases = expand_job(SWEEP)
+    print(f"cases: {len(cases)}, samples per case: {len(TIME_AXIS.lazy()):,}")
+    print(
+        f"{'workers':>8} {'seconds':>9} {'cases/s':>9} {'speedup':>8} {'efficiency':>10}"
+    )
+
+    baseline = None
+    for workers in [int(arg) for arg in sys.argv[1:]] or worker_counts():
+        start = time.perf_counter()
+        classify_sweep(cases, TIME_AXIS, workers=workers, analytic=False)
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(
+            f"{workers:>8} {elapsed:>9.2f} {len(cases) / elapsed:>9.0f} "
+            f"{speedup:>7.2f}x {speedup / workers:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
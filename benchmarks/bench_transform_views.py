@@ -0,0 +1,59 @@
+"""
+Deriving a transformed signal: immutable views vs copying the expression
+tree first (what the page's copy.deepcopy used to do), by tree size.
+
+Run from the repository root:
+    python -m benchmarks.bench_transform_views
+"""
+
+import copy
+import timeit
+
+from src.core.signals import rectangular_pulse, sinusoid
+
+TREE_SIZES = (1, 16, 256, 2048)
+NUMBER = 200
+
+
+def build_tree(n_leaves):
+    """Balanced sum of n_leaves sinusoids and pulses"""
+    nodes = [
+        sinusoid(1.0, 1.0 + i, 0.1 * i) if i % 2 else rectangular_pulse(-i, i)
+        for i in range(n_leaves)
+    ]
+    while len(nodes) > 1:
+        pairs = [a + b for a, b in zip(nodes[::2], nodes[1::2])]
+        nodes = pairs + nodes[len(pairs) * 2 :]
+    return nodes[0]
+
+
+def derive_view(signal):
+    return signal.time_shift(0.5).time_scale(2.0).fold()
+
+
+def copy_tree(signal):
+    """Node-by-node copy of the tree (deepcopy minus its memo bookkeeping)"""
+    node = copy.copy(signal)
+    node.operands = tuple(copy_tree(operand) for operand in signal.operands)
+    node.params = dict(signal.params)
+    return node
+
+
+def derive_copy(signal):
+    return copy_tree(signal).time_shift(0.5).time_scale(2.0).fold()
+
+
+def main():
+    print(f"{'leaves':>7} {'copy µs':>12} {'view µs':>9} {'speedup':>9}")
+    for n_leaves in TREE_SIZES:
+        signal = build_tree(n_leaves)
+        view_s = timeit.timeit(lambda: derive_view(signal), number=NUMBER) / NUMBER
+        copy_s = timeit.timeit(lambda: derive_copy(signal), number=NUMBER) / NUMBER
+        print(
+            f"{n_leaves:>7} {copy_s * 1e6:>12.1f} {view_s * 1e6:>9.2f} "
+            f"{copy_s / view_s:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""
+Benchmark suite over the numeric hot paths, with JSON baselines.
+
+Every case runs at each sample count (1k to 10M by default) and records the
+median CPU time of several runs, looping fast cases so each run lasts long
+enough to time reliably. CPU time leaves out the time other processes hold
+the CPU. Each run is also followed by a fixed calibration workload, and
+cases are compared by their time relative to it, so a CPU that is slower
+for a while (throttled or shared with other VMs) does not read as a
+regression. A case that still looks slower than its baseline is timed again
+before it is reported; cases faster than GATE_MIN_TIME are reported but do
+not fail the run. Timings are machine-specific: record a baseline on the
+machine that will be compared against it.
+
+Run from the repository root:
+    python -m benchmarks.suite --save          # record the baseline
+    python -m benchmarks.suite                 # compare, exit 1 on regression
+    python -m benchmarks.suite -k convolve --sizes 1000 100000 --tolerance 0.5
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from src.core.convolution import convolve, stepwise_convolution
+from src.core.signals import SIGNAL_REGISTRY, rectangular_pulse, sinusoid
+from src.core.sliding import sliding_power
+from src.ui.plots import plot_signal
+from src.utils.time_axis import TimeAxis
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# A case regresses when it is this much slower than its baseline ...
+DEFAULT_TOLERANCE = 0.25
+# ... and its baseline is at least this many seconds. Faster cases are still
+# reported, but scheduler and cache noise on a shared machine moves them by
+# more than the tolerance, so they do not fail the run.
+GATE_MIN_TIME = 1e-3
+
+# CPU time of this process: while other processes hold the CPU, the clock
+# does not advance, so a busy machine does not slow the measured cases
+CLOCK = time.process_time
+
+# Runs per measurement: enough to fill TIME_BUDGET seconds, within these bounds
+MIN_REPEAT = 7
+MAX_REPEAT = 50
+TIME_BUDGET = 0.5
+# Each timed run loops a fast case until it lasts at least this long, so
+# sub-millisecond cases are not decided by a handful of scheduler blips
+MIN_RUN_TIME = 0.01
+
+# Extra measurements of a case over tolerance before it counts as regressed,
+# spaced RETIME_PAUSE seconds apart to get past short bursts of machine load
+RETIME_ATTEMPTS = 3
+RETIME_PAUSE = 1.0
+
+# Measurements per case when saving; the baseline keeps their median, so one
+# unusually fast or slow measurement does not become the reference
+SAVE_ATTEMPTS = 3
+
+# Statistic stored in baselines; older baselines are not comparable
+STATISTIC = "median/cpu/calibrated"
+
+T_SPAN = (-5.0, 5.0)
+SLIDING_WINDOW = 1001
+CONVOLUTION_KERNEL = 257
+STEPWISE_KERNEL = 32
+
+# setup(n) -> zero-argument callable to time; cases skip sizes above max_samples
+Case = namedtuple("Case", ["name", "setup", "max_samples"])
+
+# seconds per call, and the same relative to the calibration workload
+Timing = namedtuple("Timing", ["seconds", "relative"])
+
+
+# Cases
+# -----------------------------------------------------------------------
+def _time(n):
+    return np.linspace(*T_SPAN, n)
+
+
+def _time_axis(n):
+    dt = (T_SPAN[1] - T_SPAN[0]) / (n - 1)
+    axis = TimeAxis(T_SPAN[0], T_SPAN[1] - dt / 2, dt)  # arange stops short of t_max
+    return axis.generate
+
+
+def _evaluate(factory):
+    def setup(n):
+        signal, t = factory(), _time(n)
+        return lambda: signal.evaluate(t)
+
+    return setup
+
+
+def _tree(operator, n_leaves=8):
+    """Balanced tree of n_leaves distinct sinusoids / pulses joined by operator"""
+
+    def setup(n):
+        level = [
+            sinusoid(1.0, 1.0 + i, 0.1 * i) if i % 2 else rectangular_pulse(-i, i, 1.0)
+            for i in range(n_leaves)
+        ]
+        while len(level) > 1:
+            level = [operator(a, b) for a, b in zip(level[0::2], level[1::2])]
+        signal, t = level[0], _time(n)
+        signal.compile()  # compilation is cached per signal; time evaluation only
+        return lambda: signal.evaluate(t)
+
+    return setup
+
+
+def _classify(n):
+    signal, t = sinusoid(1.0, 5.0, 0.0) + rectangular_pulse(), _time(n)
+    return lambda: signal.classify_signal(t, analytic=False)
+
+
+def _stepwise(n):
+    x, h = np.random.default_rng(0).standard_normal((2, n))
+    h = h[:STEPWISE_KERNEL]
+
+    def run():
+        for _ in stepwise_convolution(x, h):
+            pass
+
+    return run
+
+
+def _sliding_power(n):
+    x = sinusoid(1.0, 5.0, 0.0).evaluate(_time(n))
+    return lambda: sliding_power(x, SLIDING_WINDOW)
+
+
+def _convolve(n):
+    t = _time(n)
+    x = sinusoid(1.0, 5.0, 0.0).evaluate(t)
+    h = rectangular_pulse(-0.5, 0.5).evaluate(t[:CONVOLUTION_KERNEL])
+    return lambda: convolve(x, h, t_x=t, t_h=t[:CONVOLUTION_KERNEL])
+
+
+def _plot(n):
+    t = _time(n)
+    x = sinusoid(1.0, 5.0, 0.0).evaluate(t)
+    return lambda: plot_signal(t, x)
+
+
+CASES = [
+    Case("time_axis.generate", _time_axis, None),
+    *(
+        Case(f"evaluate.{key}", _evaluate(factory), None)
+        for key, factory in SIGNAL_REGISTRY.items()
+    ),
+    Case("composite.add_tree", _tree(lambda a, b: a + b), None),
+    Case("composite.mul_tree", _tree(lambda a, b: a * b), None),
+    Case("classify_signal", _classify, None),
+    Case("stepwise_convolution", _stepwise, 100_000),  # one Python step per frame
+    Case("sliding_power", _sliding_power, None),
+    Case("convolve", _convolve, None),
+    Case("plot_signal", _plot, None),
+]
+
+
+# Measurement
+# -----------------------------------------------------------------------
+def _calibration_workload():
+    """Fixed mix of NumPy kernels and interpreter work, timed next to each case"""
+    x = np.random.default_rng(0).standard_normal(20_000)
+
+    def run():
+        np.sort(x)
+        np.sin(x).sum()
+        sum(range(2_000))
+
+    return run
+
+
+CALIBRATION = _calibration_workload()
+
+
+def _loops(run):
+    """Calls of run per timed run, so that one lasts at least MIN_RUN_TIME"""
+    run()
+    start = CLOCK()
+    run()
+    single = max(CLOCK() - start, 1e-9)
+    return max(1, math.ceil(MIN_RUN_TIME / single)), single
+
+
+def _timed(run, loops):
+    start = CLOCK()
+    for _ in range(loops):
+        run()
+    return (CLOCK() - start) / loops
+
+
+def measure(run):
+    """
+    Timing of one call: median over several timed runs, after a warm-up and
+    a calibration call. A run loops the call enough times to last
+    MIN_RUN_TIME seconds and is followed by a run of the calibration
+    workload; the relative time is the median of their ratios.
+    """
+    loops, single = _loops(run)
+    calibration_loops, _ = _loops(CALIBRATION)
+    repeat = min(max(int(TIME_BUDGET / (single * loops)), MIN_REPEAT), MAX_REPEAT)
+    seconds, relative = [], []
+    for _ in range(repeat):
+        elapsed = _timed(run, loops)
+        seconds.append(elapsed)
+        relative.append(elapsed / _timed(CALIBRATION, calibration_loops))
+    return Timing(statistics.median(seconds), statistics.median(relative))
+
+
+def result_key(name, n):
+    return f"{name}[{n}]"
+
+
+def measurements(cases, sizes):
+    """{result key: (case, n)} for every case at every size it supports"""
+    return {
+        result_key(case.name, n): (case, n)
+        for case in cases
+        for n in sizes
+        if case.max_samples is None or n <= case.max_samples
+    }
+
+
+def _median_timing(timings):
+    return Timing(
+        statistics.median(t.seconds for t in timings),
+        statistics.median(t.relative for t in timings),
+    )
+
+
+def run_suite(cases, sizes, attempts=1):
+    """
+    {result key: Timing} for every case at every size it supports; with
+    several attempts, the median of their measurements
+    """
+    return {
+        key: _median_timing([measure(case.setup(n)) for _ in range(attempts)])
+        for key, (case, n) in measurements(cases, sizes).items()
+    }
+
+
+def retime_regressions(results, baseline, tolerance, cases, sizes):
+    """
+    Measure cases over tolerance again and keep their fastest relative
+    time, so only a slowdown that persists across RETIME_ATTEMPTS runs is
+    reported.
+    """
+    lookup = measurements(cases, sizes)
+    for key, *_, regressed in compare(results, baseline, tolerance):
+        attempts = 0
+        while regressed and attempts < RETIME_ATTEMPTS:
+            time.sleep(RETIME_PAUSE)
+            case, n = lookup[key]
+            results[key] = min(
+                results[key], measure(case.setup(n)), key=lambda t: t.relative
+            )
+            regressed = compare({key: results[key]}, baseline, tolerance)[0][-1]
+            attempts += 1
+    return results
+
+
+# Baselines
+# -----------------------------------------------------------------------
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def load_baseline(path):
+    path = Path(path)
+    if not path.exists():
+        return None
+    with path.open() as f:
+        return json.load(f)
+
+
+def save_baseline(path, results, previous=None):
+    """
+    Write results (seconds, and relative to the calibration workload),
+    keeping baseline entries for cases not run this time
+    """
+    comparable = previous and previous.get("statistic") == STATISTIC
+    seconds = dict(previous["results"]) if comparable else {}
+    relative = dict(previous["relative"]) if comparable else {}
+    seconds.update((key, t.seconds) for key, t in results.items())
+    relative.update((key, t.relative) for key, t in results.items())
+    with Path(path).open("w") as f:
+        json.dump(
+            {
+                "environment": environment(),
+                "statistic": STATISTIC,
+                "results": seconds,
+                "relative": relative,
+            },
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    [(key, baseline s, current s, ratio, regressed)]; None baseline for new
+    cases. The ratio is of times relative to the calibration workload.
+    """
+    rows = []
+    for key, current in results.items():
+        reference = baseline["results"].get(key)
+        reference_relative = baseline.get("relative", {}).get(key)
+        if reference is None or reference_relative is None:
+            rows.append((key, reference, current.seconds, None, False))
+            continue
+        ratio = current.relative / reference_relative
+        regressed = ratio > 1 + tolerance and reference >= GATE_MIN_TIME
+        rows.append((key, reference, current.seconds, ratio, regressed))
+    return rows
+
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1e3:.3f}"
+
+
+# Command Line
+# -----------------------------------------------------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Time the numeric hot paths and compare against a baseline.",
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON")
+    parser.add_argument(
+        "--save", action="store_true", help="record the results as the baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="allowed slowdown as a fraction (0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=SIZES, help="sample counts"
+    )
+    parser.add_argument(
+        "-k", dest="pattern", default=None, help="only cases whose name contains this"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    cases = [c for c in CASES if args.pattern is None or args.pattern in c.name]
+    if not cases:
+        print(f"No case matches {args.pattern!r}", file=sys.stderr)
+        return 2
+
+    baseline = load_baseline(args.baseline)
+    results = run_suite(cases, args.sizes, SAVE_ATTEMPTS if args.save else 1)
+
+    if args.save:
+        save_baseline(args.baseline, results, baseline)
+        for key, timing in results.items():
+            print(f"{key:>40} {_ms(timing.seconds):>12} ms")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        for key, timing in results.items():
+            print(f"{key:>40} {_ms(timing.seconds):>12} ms")
+        print(f"No baseline at {args.baseline}; record one with --save")
+        return 0
+
+    if baseline["environment"].get("machine") != platform.machine():
+        print("Warning: baseline was recorded on a different machine type")
+    if baseline.get("statistic") != STATISTIC:
+        print(f"Baseline does not store {STATISTIC} times; re-record it with --save")
+        return 2
+
+    results = retime_regressions(results, baseline, args.tolerance, cases, args.sizes)
+    rows = compare(results, baseline, args.tolerance)
+    print(f"{'case':>40} {'baseline ms':>12} {'now ms':>12} {'ratio':>7}")
+    for key, reference, current, ratio, regressed in rows:
+        ratio_text = "new" if ratio is None else f"{ratio:.2f}x"
+        if regressed:
+            flag = "  REGRESSED"
+        elif ratio is not None and ratio > 1 + args.tolerance:
+            flag = f"  slower (under {GATE_MIN_TIME * 1e3:g} ms, not gated)"
+        else:
+            flag = ""
+        print(
+            f"{key:>40} {_ms(reference):>12} {_ms(current):>12} {ratio_text:>7}{flag}"
+        )
+
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than baseline by more than "
+            f"{args.tolerance:.0%}: {', '.join(regressions)}"
+        )
+        return 1
+    print(f"All {len(rows)} cases within {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
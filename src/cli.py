@@ -0,0 +1,246 @@
+"""
+Headless batch runs: evaluate signal sweeps without Streamlit.
+
+    python -m src.cli sweep.json --out results/
+
+Spec format:
+    {
+      "time": {"t_min": -5, "t_max": 5, "fs": 1000, "mode": "Continuous",
+               "precision": "float64"},
+      "jobs": [
+        {"signal": "Sinusoidal",
+         "params": {"amplitude": 1.0, "frequency": [1, 2, 5]},
+         "transforms": {"shift": [0.0, 0.5]},
+         "convolve_with": {"signal": "rectangular", "params": {"end": 0.5}}}
+      ]
+    }
+
+List-valued params / transforms are swept (cartesian product). Per job the
+samples are written as one (n_cases, n_samples) .npy array; metrics for all
+cases go to metrics.parquet (or metrics.csv without pyarrow).
+"precision": "float32" halves the sample files; metrics still integrate in
+float64.
+"""
+
+import argparse
+import csv
+import importlib
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.core.convolution import convolve
+from src.core.sweep import create_signal, expand_job, job_time
+from src.utils.precision import DEFAULT_PRECISION, PRECISIONS
+from src.utils.time_axis import TimeAxis
+
+# Imported on first use (convolve, sinc energy); loaded before the sweep is
+# timed so the one-time import is not counted against throughput
+LAZY_IMPORTS = ("scipy.signal", "scipy.special")
+
+METRIC_FIELDS = (
+    "job",
+    "case",
+    "signal",
+    "params",
+    "shift",
+    "scale",
+    "fold",
+    "n_samples",
+    "classification",
+    "energy",
+    "power",
+)
+
+
+def _time_axis(spec):
+    return TimeAxis(
+        t_min=float(spec["t_min"]),
+        t_max=float(spec["t_max"]),
+        dt=1.0 / float(spec["fs"]),
+        signal_mode=spec.get("mode", "Continuous"),
+        precision=spec.get("precision", DEFAULT_PRECISION),
+    )
+
+
+def run_job(index, job, defaults, out_dir, save_samples=True):
+    """
+    Evaluate every case of one job.
+    Returns (metric rows, number of samples computed).
+    """
+    try:
+        cases = expand_job(job)
+    except ValueError as exc:
+        raise ValueError(f"Job {index}: {exc}") from exc
+    axis = _time_axis(job_time(job, defaults))
+    t = axis.generate()
+    prefix = f"job{index:03d}_{cases[0]['signal']}"
+
+    samples = kernel = convolved = None
+    if save_samples:
+        np.save(out_dir / f"{prefix}_time.npy", t)
+        # Written straight to disk, so RAM does not grow with the sweep size
+        samples = np.lib.format.open_memmap(
+            out_dir / f"{prefix}_samples.npy",
+            mode="w+",
+            dtype=t.dtype,
+            shape=(len(cases), len(t)),
+        )
+
+    if "convolve_with" in job:
+        h_case = expand_job(job["convolve_with"])[0]
+        kernel = create_signal(**h_case).evaluate(t)
+
+    rows = []
+    n_computed = 0
+    for case_index, case in enumerate(cases):
+        signal = create_signal(**case)
+        x = signal.evaluate(t)
+        classification, E, P = signal.classify_signal(axis.lazy())
+        n_computed += len(t)
+
+        if samples is not None:
+            samples[case_index] = x
+
+        if kernel is not None:
+            t_y, y = convolve(x, kernel, t_x=t, t_h=t)
+            n_computed += len(y)
+            if save_samples:
+                if convolved is None:
+                    np.save(out_dir / f"{prefix}_convolution_time.npy", t_y)
+                    convolved = np.lib.format.open_memmap(
+                        out_dir / f"{prefix}_convolution.npy",
+                        mode="w+",
+                        dtype=y.dtype,
+                        shape=(len(cases), len(y)),
+                    )
+                convolved[case_index] = y
+
+        rows.append(
+            {
+                "job": index,
+                "case": case_index,
+                "signal": case["signal"],
+                "params": json.dumps(case["params"], sort_keys=True),
+                "shift": case["shift"],
+                "scale": case["scale"],
+                "fold": case["fold"],
+                "n_samples": len(t),
+                "classification": classification,
+                "energy": float(E),
+                "power": float(P),
+            }
+        )
+
+    for array in (samples, convolved):
+        if array is not None:
+            array.flush()
+
+    return rows, n_computed
+
+
+def write_metrics(rows, out_dir, table_format="auto"):
+    """Write metric rows as Parquet (needs pyarrow) or CSV; returns the path"""
+    if table_format in ("auto", "parquet"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            if table_format == "parquet":
+                raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+        else:
+            path = out_dir / "metrics.parquet"
+            columns = {field: [row[field] for row in rows] for field in METRIC_FIELDS}
+            pq.write_table(pa.table(columns), path)
+            return path
+
+    path = out_dir / "metrics.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=METRIC_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def run_sweep(spec, out_dir, save_samples=True, table_format="auto"):
+    """Run every job of a sweep spec; returns a summary dict"""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    for module in LAZY_IMPORTS:
+        importlib.import_module(module)
+
+    rows = []
+    n_samples = 0
+    start = time.perf_counter()
+    for index, job in enumerate(spec["jobs"]):
+        job_rows, job_samples = run_job(
+            index, job, spec.get("time"), out_dir, save_samples
+        )
+        rows.extend(job_rows)
+        n_samples += job_samples
+    elapsed = time.perf_counter() - start
+
+    metrics_path = write_metrics(rows, out_dir, table_format)
+    return {
+        "cases": len(rows),
+        "samples": n_samples,
+        "seconds": elapsed,
+        "samples_per_second": n_samples / elapsed if elapsed > 0 else float("inf"),
+        "metrics": str(metrics_path),
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Evaluate signal sweeps headlessly and write .npy / Parquet",
+    )
+    parser.add_argument("spec", help="sweep spec (JSON file, '-' for stdin)")
+    parser.add_argument("--out", default="results", help="output directory")
+    parser.add_argument(
+        "--table",
+        choices=("auto", "parquet", "csv"),
+        default="auto",
+        help="metrics table format (auto: Parquet if pyarrow is installed)",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=tuple(PRECISIONS),
+        help="default sample precision (a time.precision in the spec wins)",
+    )
+    parser.add_argument(
+        "--no-samples",
+        action="store_true",
+        help="only compute metrics, do not write sample arrays",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.spec == "-":
+        spec = json.load(sys.stdin)
+    else:
+        with open(args.spec) as f:
+            spec = json.load(f)
+
+    if args.precision:
+        spec.setdefault("time", {}).setdefault("precision", args.precision)
+
+    summary = run_sweep(
+        spec, args.out, save_samples=not args.no_samples, table_format=args.table
+    )
+    print(
+        f"{summary['cases']} cases, {summary['samples']:,} samples in "
+        f"{summary['seconds']:.3f} s ({summary['samples_per_second']:,.0f} samples/s)"
+    )
+    print(f"metrics: {summary['metrics']}")
+
+
+if __name__ == "__main__":
+    main()
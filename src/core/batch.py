@@ -0,0 +1,87 @@
+import numpy as np
+
+from src.utils.precision import as_precision, sample_dtype
+
+# Working-memory budget per tile (output rows plus the factory's temporaries)
+DEFAULT_TILE_BYTES = 64 * 1024**2
+
+# Factory lambdas allocate a few full-size temporaries per output row
+_TEMPORARIES_PER_ROW = 4
+
+
+def _batch_params(signal, params):
+    """Validate batch params; returns ({name: column vector}, n_params)"""
+    if signal.op is not None:
+        raise ValueError("Batched evaluation needs a leaf signal, not a composite")
+
+    unknown = set(params) - set(signal.params)
+    if unknown:
+        raise ValueError(f"{signal.name} has no parameters {sorted(unknown)}")
+
+    vectors = {name: np.asarray(value) for name, value in params.items()}
+    lengths = {v.size for v in vectors.values() if v.ndim > 0}
+    if len(lengths) > 1:
+        raise ValueError("All parameter vectors must have the same length")
+    n_params = lengths.pop() if lengths else 1
+
+    columns = {
+        name: v.reshape(-1, 1) if v.ndim > 0 else v for name, v in vectors.items()
+    }
+    return columns, n_params
+
+
+def tile_rows(n_samples, itemsize=8, tile_bytes=DEFAULT_TILE_BYTES):
+    """Parameter rows per tile that keep one tile within tile_bytes"""
+    row_bytes = max(n_samples, 1) * itemsize * _TEMPORARIES_PER_ROW
+    return max(1, int(tile_bytes // row_bytes))
+
+
+def _tiles(signal, t, params, tile_bytes):
+    columns, n_params = _batch_params(signal, params)
+    t_final = np.asarray(signal.transformed_time(t))[np.newaxis, :]
+    if tile_bytes is None:
+        rows_per_tile = n_params
+    else:
+        rows_per_tile = tile_rows(t_final.size, tile_bytes=tile_bytes)
+
+    for start in range(0, n_params, rows_per_tile):
+        rows = slice(start, min(start + rows_per_tile, n_params))
+        tile_params = dict(signal.params)
+        for name, column in columns.items():
+            tile_params[name] = column[rows] if column.ndim > 0 else column
+
+        # Raw result: may broadcast to fewer rows / samples than requested
+        tile = signal.func(t_final, **tile_params)
+        yield rows, t_final.size, as_precision(tile, sample_dtype(t_final))
+
+
+def iter_batch(signal, t, params, tile_bytes=DEFAULT_TILE_BYTES):
+    """
+    Evaluate a signal for many parameter sets, one tile of rows at a time.
+
+    params : {name: scalar | 1-D array}; arrays (all the same length n_params)
+             override signal.params row by row, scalars apply to every row
+    Yields (rows, tile) where tile has shape (len(rows), n_samples).
+    """
+    for rows, n_samples, tile in _tiles(signal, t, params, tile_bytes):
+        yield rows, np.broadcast_to(tile, (rows.stop - rows.start, n_samples))
+
+
+def evaluate_batch(signal, t, params, out=None, tile_bytes=None):
+    """
+    Evaluate a signal over a parameter grid with broadcasting.
+
+    sinusoid() with params={"frequency": np.linspace(1, 100, 1000)} returns a
+    (1000, len(t)) array from one vectorized call instead of 1000 evaluate()
+    calls. With tile_bytes set, rows are filled tile by tile so temporaries
+    stay bounded; pass a np.memmap as `out` to keep the result out of RAM.
+    """
+    _, n_params = _batch_params(signal, params)
+    for rows, n_samples, tile in _tiles(signal, t, params, tile_bytes):
+        shape = (n_params, n_samples)
+        if out is None and np.shape(tile) == shape:
+            return tile  # single full tile: no copy
+        if out is None:
+            out = np.empty(shape, dtype=np.result_type(tile))
+        out[rows] = tile
+    return out
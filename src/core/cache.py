@@ -0,0 +1,134 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Memory budget of the shared evaluation cache
+DEFAULT_CACHE_BYTES = 256 * 1024**2
+
+# Bookkeeping cost charged per entry on top of its arrays
+_ENTRY_OVERHEAD = 256
+
+
+def _nbytes(value):
+    """Approximate memory held by a cached value"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+def _freeze_arrays(value):
+    """Make cached arrays read-only so callers cannot corrupt the cache"""
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _freeze_arrays(v)
+    return value
+
+
+class EvaluationCache:
+    """Bounded LRU cache with a byte budget and hit / miss counters"""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for `key`, computing and storing it on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        value = _freeze_arrays(compute())
+        self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        size = _nbytes(value) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return  # larger than the whole budget: never cache
+
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+
+            # Evict least recently used entries
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Counters for display / logging"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Shared across Streamlit reruns (module state lives for the server process)
+EVALUATION_CACHE = EvaluationCache()
+
+
+# Cache keys
+# -----------------------------------------------------------------------
+def time_axis_key(time_axis):
+    """(t_min, t_max, dt, mode, precision) of a TimeAxis"""
+    return (
+        time_axis.t_min,
+        time_axis.t_max,
+        time_axis.dt,
+        time_axis.signal_mode,
+        time_axis.dtype.name,
+    )
+
+
+def signal_key(signal):
+    """Factory name plus params, transform state and operands of a Signal"""
+    return (signal.name, signal.key())
+
+
+# Cached operations
+# -----------------------------------------------------------------------
+def cached_time(time_axis, cache=EVALUATION_CACHE):
+    """Sample vector of a TimeAxis"""
+    return cache.get_or_compute(("time", time_axis_key(time_axis)), time_axis.generate)
+
+
+def cached_evaluate(signal, time_axis, cache=EVALUATION_CACHE):
+    """Return (t, x) for a Signal over a TimeAxis"""
+    t = cached_time(time_axis, cache)
+    key = ("evaluate", signal_key(signal), time_axis_key(time_axis))
+    x = cache.get_or_compute(key, lambda: signal.evaluate(t))
+    return t, x
+
+
+def cached_classify(signal, time_axis, cache=EVALUATION_CACHE):
+    """Return Signal.classify_signal over a TimeAxis (streamed in chunks)"""
+    key = ("classify", signal_key(signal), time_axis_key(time_axis))
+    return cache.get_or_compute(key, lambda: signal.classify_signal(time_axis.lazy()))
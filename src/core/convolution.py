@@ -1,25 +1,167 @@
+from collections import namedtuple
+
 import numpy as np
 
+from src.utils.precision import sample_dtype
+from src.utils.profiling import profiled
+
+# Cost model (relative units: one direct multiply-accumulate = 1)
+# An FFT pass costs roughly this many MACs per N·log2(N)
+FFT_COST_FACTOR = 20.0
+# Overlap-add only pays off once one signal is much longer than the other
+OVERLAP_ADD_MIN_RATIO = 4
+
+CONVOLUTION_METHODS = ("auto", "direct", "fft", "overlap-add")
+
+# Relative difference allowed between the steps of x and h; purely relative,
+# so it holds at any step size
+STEP_RTOL = 1e-6
+
+ConvolutionFrame = namedtuple(
+    "ConvolutionFrame", ["n", "k_start", "k_stop", "h_shifted", "product", "partial"]
+)
+
+
+def convolution_costs(n_x, n_h):
+    """Estimated cost of each convolution method for lengths n_x and n_h"""
+    n_out = n_x + n_h - 1
+    short, long = sorted((n_x, n_h))
+
+    costs = {
+        "direct": float(n_x) * n_h,
+        "fft": FFT_COST_FACTOR * n_out * np.log2(max(n_out, 2)),
+    }
+
+    if long >= OVERLAP_ADD_MIN_RATIO * short:
+        # Blocks of the long signal, FFT size ~8x the short one
+        nfft = 1 << int(np.ceil(np.log2(8 * short)))
+        block = nfft - short + 1
+        n_blocks = -(-long // block)
+        costs["overlap-add"] = FFT_COST_FACTOR * n_blocks * nfft * np.log2(nfft)
+
+    return costs
+
+
+def choose_method(n_x, n_h):
+    """Cheapest convolution method according to the cost model"""
+    costs = convolution_costs(n_x, n_h)
+    return min(costs, key=costs.get)
+
+
+def _step(t):
+    """Sample step of a uniform axis, averaged over its full span in float64"""
+    return (float(t[-1]) - float(t[0])) / (len(t) - 1)
+
+
+def _step_rounding(t):
+    """Error in _step from rounding the end points to t's dtype (float32 axes)"""
+    eps = np.finfo(sample_dtype(t)).eps
+    return 2 * eps * max(abs(float(t[0])), abs(float(t[-1]))) / (len(t) - 1)
+
+
+def _same_step(t_x, t_h):
+    dt_x, dt_h = _step(t_x), _step(t_h)
+    allowed = STEP_RTOL * max(abs(dt_x), abs(dt_h))
+    return abs(dt_x - dt_h) <= allowed + _step_rounding(t_x) + _step_rounding(t_h)
+
+
+@profiled()
+def convolve(x, h, t_x=None, t_h=None, continuous=True, method="auto"):
+    """
+    Linear convolution y = x * h using direct, FFT or overlap-add.
+
+    x, h       : sampled signals
+    t_x, t_h   : uniform time axes with the same step (optional)
+    continuous : scale the sum by dt so it approximates ∫ x(τ) h(t-τ) dτ
+    method     : "auto" | "direct" | "fft" | "overlap-add"
+
+    Returns (t_y, y) where t_y starts at t_x[0] + t_h[0].
+    Without time axes, sample indices are used (dt = 1).
+    Float32 inputs give float32 output; dt and t_y are derived in float64.
+    """
+    x = np.asarray(x)
+    h = np.asarray(h)
+    n_x, n_h = len(x), len(h)
+    if n_x == 0 or n_h == 0:
+        raise ValueError("Cannot convolve empty signals")
+
+    if method not in CONVOLUTION_METHODS:
+        raise ValueError(f"Unknown convolution method: {method}")
+    if method == "auto":
+        method = choose_method(n_x, n_h)
+
+    # Time axes
+    # ---------------------------------
+    dt_x = _step(t_x) if t_x is not None and n_x > 1 else None
+    dt_h = _step(t_h) if t_h is not None and n_h > 1 else None
+    if dt_x is not None and dt_h is not None and not _same_step(t_x, t_h):
+        raise ValueError("x and h must be sampled with the same time step")
+
+    dt = dt_x if dt_x is not None else dt_h
+    if dt is None:
+        dt = 1.0
+    t0 = (float(t_x[0]) if t_x is not None else 0.0) + (
+        float(t_h[0]) if t_h is not None else 0.0
+    )
+
+    # Convolution
+    # ---------------------------------
+    if method == "direct":
+        y = np.convolve(x, h, mode="full")
+    else:
+        from scipy.signal import fftconvolve, oaconvolve
+
+        if method == "fft":
+            y = fftconvolve(x, h, mode="full")
+        else:
+            y = oaconvolve(x, h, mode="full")
+
+    if continuous:
+        y = y * dt
+
+    t_y = t0 + dt * np.arange(n_x + n_h - 1)
+    if t_x is not None:
+        t_y = t_y.astype(sample_dtype(t_x), copy=False)
+    return t_y, y
+
 
 def stepwise_convolution(x, h):
     """
-    Compute stepwise convolution arrays for animation.
-    Returns a list of outputs for each shift.
+    Lazily produce convolution frames for animation, one per output index n.
+
+    Each ConvolutionFrame holds:
+    - k_start, k_stop : overlap of x[k] and h[n-k] (indices into x)
+    - h_shifted       : h[n-k] over the overlap (view into reversed h)
+    - product         : x[k]·h[n-k] over the overlap
+    - partial         : y[0..n], the output computed so far
+
+    `product` and `partial` are views into one preallocated buffer and are
+    overwritten by the next frame; copy them if they must be kept.
+    Memory is O(len(x) + len(h)) and each frame costs O(overlap).
     """
+    x = np.asarray(x)
+    h = np.asarray(h)
     n_x = len(x)
     n_h = len(h)
     n_out = n_x + n_h - 1
+    n_overlap = min(n_x, n_h)
 
-    y_full = np.convolve(x, h, mode="full")
-    outputs = []
+    h_reversed = h[::-1]
+    buffer = np.empty(n_overlap + n_out, dtype=np.result_type(x, h))
+    product_buffer = buffer[:n_overlap]
+    y = buffer[n_overlap:]
 
     # Step through each time shift of h
-    for i in range(n_out):
-        # Zero-pad h to match full length and shift
-        h_shifted = np.zeros(n_out)
-        if i < n_h:
-            h_shifted[i : i + n_h] = h[: n_h - i]
-        else:
-            h_shifted[i : i + n_h] = h
-        outputs.append(y_full[:n_out])
-    return outputs, y_full
+    for n in range(n_out):
+        k_start = max(0, n - n_h + 1)
+        k_stop = min(n, n_x - 1) + 1
+        width = k_stop - k_start
+
+        # h[n-k] for k in [k_start, k_stop) is a contiguous run of reversed h
+        j = n_h - 1 - n + k_start
+        h_shifted = h_reversed[j : j + width]
+
+        product = np.multiply(x[k_start:k_stop], h_shifted, out=product_buffer[:width])
+        y[n] = product.sum()
+
+        yield ConvolutionFrame(n, k_start, k_stop, h_shifted, product, y[: n + 1])
@@ -0,0 +1,253 @@
+import types
+from collections.abc import Mapping
+
+import numpy as np
+
+from src.utils.precision import as_precision, sample_dtype
+from src.utils.time_axis import LazyTimeAxis
+
+IDENTITY_TRANSFORM = (0.0, 1.0, False)  # (τ, a, fold)
+
+_UFUNCS = {"add": np.add, "mul": np.multiply}
+
+# Step kinds
+_LEAF = 0
+_NODE = 1
+
+
+class _Identity:
+    """
+    Key by object identity. Holds the object, so its id cannot be reused by
+    a new object while a cache entry keyed on it is alive.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.value is self.value
+
+
+def _global_names(code):
+    """Names a code object (and the code nested in it) may read as globals"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _global_values(func):
+    """Frozen values of the module globals func reads (modules left out)"""
+    namespace = func.__globals__
+    return tuple(
+        sorted(
+            (name, freeze(namespace[name]))
+            for name in _global_names(func.__code__)
+            if name in namespace and not isinstance(namespace[name], types.ModuleType)
+        )
+    )
+
+
+def func_identity(func):
+    """
+    Hashable identity of a signal function.
+    Python functions are identified by their code, defaults, closure cell
+    contents and the globals they read, so two factory calls with equal
+    arguments match and functions that differ only in captured values do
+    not. Anything else (builtins, ufuncs, callable objects) falls back to
+    object identity.
+    """
+    if not hasattr(func, "__code__"):
+        return _Identity(func)
+    try:
+        cells = tuple(freeze(cell.cell_contents) for cell in func.__closure__ or ())
+    except ValueError:  # a cell not assigned yet
+        return _Identity(func)
+    return (
+        func.__code__,
+        freeze(func.__defaults__ or ()),
+        freeze(func.__kwdefaults__ or {}),
+        cells,
+        _global_values(func),
+    )
+
+
+def freeze(value):
+    """Convert params (dicts, lists, arrays) into a hashable key"""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return ("ndarray", value.dtype.str, value.shape, value.tobytes())
+    if callable(getattr(value, "key", None)):  # a Signal passed as a parameter
+        return ("signal", value.key())
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+    return value
+
+
+def _flatten(node):
+    """Operands of a chain of same-op nodes with no transform of their own"""
+    operands = []
+    stack = list(reversed(node.operands))
+    while stack:
+        operand = stack.pop()
+        if operand.op == node.op and operand.transform == IDENTITY_TRANSFORM:
+            stack.extend(reversed(operand.operands))
+        else:
+            operands.append(operand)
+    return operands
+
+
+class _BufferPool:
+    """Reusable output buffers for one evaluation pass"""
+
+    def __init__(self):
+        self._free = {}
+
+    def take(self, shape, dtype):
+        free = self._free.get((shape, dtype))
+        if free:
+            return free.pop()
+        return np.empty(shape, dtype=dtype)
+
+    def give(self, buffer):
+        self._free.setdefault((buffer.shape, buffer.dtype), []).append(buffer)
+
+
+class CompiledSignal:
+    """
+    Flat evaluation program for a Signal expression tree.
+
+    Compilation:
+    - nested sums / products are flattened into n-ary nodes
+    - time transforms are composed from root to leaf; leaves sharing the same
+      transform chain share one transformed time array
+    - identical subexpressions are evaluated once
+    - intermediate results accumulate into pooled `out=` buffers that are
+      recycled as soon as their last consumer has run
+    """
+
+    def __init__(self, signal):
+        self.steps = []
+        self._memo = {}
+        self._chain_last_use = {}
+        self.root = self._emit(signal, ())
+
+        # Liveness: last step reading each slot
+        self._slot_last_use = {}
+        for index, (kind, _, args) in enumerate(self.steps):
+            if kind == _NODE:
+                for slot in args[1]:
+                    self._slot_last_use[slot] = index
+
+    # -------- Compilation --------
+    def _emit(self, node, chain):
+        if node.transform != IDENTITY_TRANSFORM:
+            chain = chain + (node.transform,)
+
+        if node.op is None:
+            key = ("leaf", func_identity(node.func), freeze(node.params), chain)
+            if key not in self._memo:
+                self._memo[key] = len(self._memo)
+                # Mark the chain and all its prefixes as used by this step
+                for depth in range(len(chain) + 1):
+                    self._chain_last_use[chain[:depth]] = len(self.steps)
+                self.steps.append(
+                    (_LEAF, self._memo[key], (chain, node.func, node.params))
+                )
+            return self._memo[key]
+
+        children = tuple(self._emit(operand, chain) for operand in _flatten(node))
+        key = (node.op, children)
+        if key not in self._memo:
+            self._memo[key] = len(self._memo)
+            self.steps.append((_NODE, self._memo[key], (node.op, children)))
+        return self._memo[key]
+
+    @property
+    def n_leaves(self):
+        return sum(1 for kind, _, _ in self.steps if kind == _LEAF)
+
+    @property
+    def n_chains(self):
+        return len(self._chain_last_use)
+
+    # -------- Evaluation --------
+    def __call__(self, t):
+        values = {}
+        times = {(): t}
+        dtype = sample_dtype(t)
+        pool = _BufferPool()
+        owned = set()  # slots whose value is a pool buffer
+
+        for index, (kind, slot, args) in enumerate(self.steps):
+            if kind == _LEAF:
+                chain, func, params = args
+                t_leaf = self._time(chain, times)
+                if isinstance(t_leaf, LazyTimeAxis):
+                    # Materialize once per chain, shared by its leaves
+                    t_leaf = times[chain] = t_leaf.to_array()
+                values[slot] = as_precision(func(t_leaf, **params), dtype)
+            else:
+                op, children = args
+                operands = [values[child] for child in children]
+                shape = np.broadcast_shapes(*(np.shape(v) for v in operands))
+                out = pool.take(shape, np.result_type(*operands))
+                ufunc = _UFUNCS[op]
+                ufunc(operands[0], operands[1], out=out)
+                for operand in operands[2:]:
+                    ufunc(out, operand, out=out)
+                values[slot] = out
+                owned.add(slot)
+
+                # Recycle operands that are no longer needed
+                for child in set(children):
+                    if self._slot_last_use[child] == index:
+                        value = values.pop(child)
+                        if child in owned:
+                            owned.discard(child)
+                            pool.give(value)
+
+            # Drop transformed time arrays after their last leaf
+            for chain in [c for c in times if c]:
+                if self._chain_last_use[chain] == index:
+                    del times[chain]
+
+        return values[self.root]
+
+    @staticmethod
+    def _time(chain, times):
+        if chain in times:
+            return times[chain]
+
+        parent = CompiledSignal._time(chain[:-1], times)
+        shift, scale, fold = chain[-1]
+
+        if isinstance(parent, LazyTimeAxis):
+            t_final = parent.shift(shift).scale(scale)
+            times[chain] = t_final.fold() if fold else t_final
+            return times[chain]
+
+        # Same operation order as Signal.evaluate, one buffer per chain
+        t_final = None
+        if shift != 0.0:
+            t_final = np.subtract(parent, shift)
+        if scale != 1.0:
+            source = parent if t_final is None else t_final
+            t_final = np.multiply(scale, source, out=t_final)
+        if fold:
+            source = parent if t_final is None else t_final
+            t_final = np.negative(source, out=t_final)
+
+        times[chain] = t_final
+        return t_final
@@ -0,0 +1,62 @@
+import numpy as np
+
+from src.utils.time_axis import DEFAULT_CHUNK_SIZE
+
+
+class CompensatedSum:
+    """Neumaier (improved Kahan) running sum"""
+
+    def __init__(self):
+        self.total = 0.0
+        self._compensation = 0.0
+
+    def add(self, value):
+        value = float(value)
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self._compensation += (self.total - total) + value
+        else:
+            self._compensation += (value - total) + self.total
+        self.total = total
+
+    @property
+    def value(self):
+        return self.total + self._compensation
+
+
+def iter_energy(signal, t, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Stream the trapezoidal energy ∫ |x(t)|² dt over a LazyTimeAxis.
+
+    The signal is evaluated chunk by chunk, so memory stays bounded by
+    chunk_size. Chunk sums are pairwise (np.sum) and combined with
+    compensated summation. Yields (t_end, running_energy) after every chunk.
+
+    On a uniform grid the trapezoid rule is
+        E = dt · (Σ |x_i|² - (|x_0|² + |x_last|²) / 2)
+    so the running value is exact trapezoid energy up to t_end.
+    """
+    total = CompensatedSum()
+    first = None
+
+    for t_chunk, x_chunk in signal.evaluate_chunks(t, chunk_size):
+        if len(t_chunk) == 0:
+            continue
+        power = np.square(np.abs(x_chunk), dtype=np.float64)
+        if first is None:
+            first = power[0]
+        total.add(np.sum(power))
+
+        last = power[-1]
+        yield t_chunk[-1], t.dt * (total.value - 0.5 * (first + last))
+
+
+def stream_energy(signal, t, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Trapezoidal energy over a LazyTimeAxis in constant memory"""
+    if len(t) < 2:
+        return 0.0
+
+    energy = 0.0
+    for _, energy in iter_energy(signal, t, chunk_size):
+        pass
+    return energy
@@ -0,0 +1,105 @@
+"""
+Periodic signals: one period of a base signal repeated forever.
+
+    x(t) = base(origin + ((t - origin) mod T))
+
+On a uniform grid whose step divides the period, only the first period is
+evaluated (and cached); the rest of the window is filled with np.resize.
+Other grids fall back to evaluating the base on the wrapped times.
+"""
+
+import numpy as np
+
+from src.core.cache import EVALUATION_CACHE
+from src.core.signals import Signal
+
+# |period / dt - round(period / dt)| allowed for the grid to count as aligned
+PERIOD_ALIGNMENT_TOLERANCE = 1e-9
+
+
+def _wrap(t, period, origin):
+    return origin + np.mod(t - origin, period)
+
+
+def _samples_per_period(t, period):
+    """Samples in one period of a uniform grid t, or None if they do not align"""
+    n = len(t)
+    if n < 2:
+        return None
+
+    dt = float(t[1]) - float(t[0])
+    if dt == 0 or not np.isclose(float(t[-1]) - float(t[0]), (n - 1) * dt):
+        return None  # not uniform
+
+    samples = period / abs(dt)
+    rounded = round(samples)
+    if rounded < 1 or abs(samples - rounded) > PERIOD_ALIGNMENT_TOLERANCE * samples:
+        return None
+    return rounded
+
+
+def _evaluate_periodic(t, base, period, origin):
+    t = np.asarray(t)
+    samples = _samples_per_period(t, period) if t.ndim == 1 else None
+    if samples is None or samples >= len(t):
+        return base.evaluate(_wrap(t, period, origin))
+
+    # First period only; the grid repeats every `samples` samples
+    phase = float(np.mod(float(t[0]) - origin, period))
+    key = (
+        "period",
+        base.key(),
+        period,
+        origin,
+        phase,
+        float(t[1]) - float(t[0]),
+        samples,
+        t.dtype.str,
+    )
+    one_period = EVALUATION_CACHE.get_or_compute(
+        key, lambda: base.evaluate(_wrap(t[:samples], period, origin))
+    )
+    return np.resize(one_period, len(t))
+
+
+def periodic(base, period, origin=0.0):
+    """
+    Repeat base over [origin, origin + period) with the given period.
+
+    For a signal that is already periodic (a sinusoid with period 1/f) the
+    samples are unchanged; for a single pulse or triangle this builds the
+    pulse / triangle wave. Energy over any window is exact when the base
+    has a closed form: whole periods times the energy of one period plus
+    the partial period at each end.
+    """
+    if period <= 0:
+        raise ValueError("Period must be positive")
+
+    period_energy = base.analytic_energy(origin, origin + period)
+    energy_antiderivative = None
+    if period_energy is not None:
+
+        def energy_antiderivative(u, base, period, origin):
+            periods, remainder = np.divmod(u - origin, period)
+            partial = base.analytic_energy(origin, origin + float(remainder))
+            return periods * period_energy + partial
+
+    return Signal(
+        func=_evaluate_periodic,
+        name=f"Periodic {base.name}",
+        formula=f"{base.formula} (T={period})",
+        params={"base": base, "period": float(period), "origin": float(origin)},
+        energy_antiderivative=energy_antiderivative,
+    )
+
+
+def average_power(signal):
+    """
+    Exact average power of a periodic() signal: energy of one period / T.
+    Time scaling changes the period but not the average; shifts and folds
+    do not change it either. None without a closed-form energy.
+    """
+    base, period = signal.params["base"], signal.params["period"]
+    origin = signal.params["origin"]
+    energy = base.analytic_energy(origin, origin + period)
+    return None if energy is None else energy / period
@@ -0,0 +1,169 @@
+"""
+Piecewise-polynomial signals.
+
+A signal is stored as sorted breakpoints b[0] <= ... <= b[K] and a
+(degree + 1, K) coefficient array, highest power first (the layout of
+scipy.interpolate.PPoly). On segment k
+
+    x(t) = Σ_j c[j, k] · (t - b[k])^(degree - j),   b[k] <= t < b[k+1]
+
+and the last segment is closed at b[K]. Outside [b[0], b[K]] the signal is 0.
+Only the outer breakpoints may be infinite; a segment starting at -inf is
+expanded around its right breakpoint instead.
+
+Evaluation is one np.searchsorted over the breakpoints plus one coefficient
+gather per polynomial degree, so N samples over K segments cost
+O(N log K) with no loop over segments.
+
+The step-like factories map onto it as
+    unit_step(c)                 b = [0, inf]      c = [[c]]
+    ramp()                       b = [0, inf]      c = [[1], [0]]
+    rectangular_pulse(s, e, A)   b = [s, e]        c = [[A]]
+    triangular_wave(s, e, A)     b = [s, m, e]     c = [[A/h, -A/h], [0, A]]
+with m = (s + e) / 2 and h = (e - s) / 2. Those factories keep their np.where
+forms, which broadcast parameter vectors (see src.core.batch).
+"""
+
+import numpy as np
+
+from src.core.signals import Signal
+
+
+def _origins(breakpoints):
+    """Expansion point of each segment"""
+    origins = breakpoints[:-1].copy()
+    if np.isneginf(origins[0]):
+        origins[0] = breakpoints[1]
+    return origins
+
+
+def _segments(t, breakpoints):
+    """Segment index of every sample, and whether it lies inside [b[0], b[K]]"""
+    n_segments = len(breakpoints) - 1
+    index = np.searchsorted(breakpoints, t, side="right") - 1
+    # The last breakpoint closes the final segment
+    index = np.where(t == breakpoints[-1], n_segments - 1, index)
+    inside = (index >= 0) & (index < n_segments)
+    return np.where(inside, index, 0), inside
+
+
+def _horner(coefficients, index, v):
+    """Σ_j c[j, index] · v^(degree - j), gathering one coefficient row at a time"""
+    x = coefficients[0, index]
+    for row in coefficients[1:]:
+        x = x * v + row[index]
+    return x
+
+
+def evaluate_piecewise(t, breakpoints, coefficients):
+    """Samples of a piecewise polynomial at t"""
+    t = np.asarray(t)
+    index, inside = _segments(t, breakpoints)
+    if coefficients.shape[0] == 1:
+        x = coefficients[0, index]
+    else:
+        x = _horner(coefficients, index, t - _origins(breakpoints)[index])
+    return np.where(inside, x, 0.0)
+
+
+# Closed-form Energy
+# -----------------------------------------------------------------------
+def _squared(coefficients):
+    """Coefficients of p(v)² per segment (degree 2·degree)"""
+    degree = coefficients.shape[0] - 1
+    squared = np.zeros((2 * degree + 1, coefficients.shape[1]))
+    for i in range(degree + 1):
+        for j in range(degree + 1):
+            squared[i + j] += coefficients[i] * coefficients[j]
+    return squared
+
+
+def _integrated(coefficients):
+    """Coefficients of ∫_0^v p(s) ds per segment"""
+    powers = np.arange(coefficients.shape[0], 0, -1)[:, np.newaxis]
+    zero = np.zeros((1, coefficients.shape[1]))
+    return np.vstack([coefficients / powers, zero])
+
+
+def _piecewise_energy(u, breakpoints, coefficients):
+    """F(u) = ∫ |x|² up to u, anchored at F(b[1]) = 0 for an infinite start"""
+    antiderivative = _integrated(_squared(coefficients))
+    origins = _origins(breakpoints)
+
+    # F at the left end of each segment: running sum of the segments before it
+    index = np.arange(coefficients.shape[1] - 1)
+    segment_energy = _horner(antiderivative, index, breakpoints[1:-1] - origins[:-1])
+    offsets = np.concatenate([[0.0], np.cumsum(segment_energy)])
+
+    u = np.clip(u, breakpoints[0], breakpoints[-1])
+    index, _ = _segments(u, breakpoints)
+    return offsets[index] + _horner(antiderivative, index, u - origins[index])
+
+
+# Factories
+# -----------------------------------------------------------------------
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+def piecewise_polynomial(breakpoints, coefficients, name="Piecewise", formula="pp(t)"):
+    """
+    Signal from breakpoints (K + 1,) and coefficients (degree + 1, K);
+    a 1-D coefficient array is one constant per segment.
+    """
+    # Copies: the stored arrays are frozen, the caller's stay writeable
+    breakpoints = np.array(breakpoints, dtype=float)
+    coefficients = np.atleast_2d(np.array(coefficients, dtype=float))
+
+    if breakpoints.ndim != 1 or len(breakpoints) < 2:
+        raise ValueError("Need at least two breakpoints")
+    if coefficients.shape[1] != len(breakpoints) - 1:
+        raise ValueError(
+            f"Expected coefficients for {len(breakpoints) - 1} segments, "
+            f"got {coefficients.shape[1]}"
+        )
+    if np.any(np.diff(breakpoints) < 0):
+        raise ValueError("Breakpoints must be sorted")
+    if not np.all(np.isfinite(breakpoints[1:-1])) or np.all(np.isinf(breakpoints)):
+        raise ValueError("Only the outer breakpoints may be infinite")
+
+    return Signal(
+        func=evaluate_piecewise,
+        name=name,
+        formula=formula,
+        params={
+            "breakpoints": _read_only(breakpoints),
+            "coefficients": _read_only(coefficients),
+        },
+        energy_antiderivative=_piecewise_energy,
+    )
+
+
+def pulse_train(starts, width, amplitude=1.0):
+    """
+    Rectangular pulses [starts[i], starts[i] + width) of the given amplitude.
+    width and amplitude may be scalars or one value per pulse; pulses must
+    not overlap. Built as a single piecewise-constant signal.
+    """
+    starts = np.atleast_1d(np.asarray(starts, dtype=float))
+    ends = starts + np.asarray(width, dtype=float)
+    amplitudes = np.broadcast_to(np.asarray(amplitude, dtype=float), starts.shape)
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends, amplitudes = starts[order], ends[order], amplitudes[order]
+    if np.any(ends < starts):
+        raise ValueError("Pulse widths must be non-negative")
+    if np.any(ends[:-1] > starts[1:]):
+        raise ValueError("Pulses must not overlap")
+
+    # Segments alternate pulse, gap, pulse, ...
+    breakpoints = np.empty(2 * len(starts))
+    breakpoints[0::2] = starts
+    breakpoints[1::2] = ends
+    coefficients = np.zeros(len(breakpoints) - 1)
+    coefficients[0::2] = amplitudes
+
+    return piecewise_polynomial(
+        breakpoints, coefficients, name="Pulse Train", formula="Σₖ aₖ·rect(t-τₖ)"
+    )
@@ -1,27 +1,98 @@
 import re
+from types import MappingProxyType
 
 import numpy as np
 
+from src.core.expression import CompiledSignal, freeze, func_identity
+from src.core.integration import stream_energy
+from src.utils.precision import ACCUMULATOR_DTYPE, as_precision, sample_dtype
+from src.utils.profiling import profiled
+from src.utils.time_axis import DEFAULT_CHUNK_SIZE, LazyTimeAxis
 
-class Signal:
-    """Core Signal Class"""
+# Standalone time variable in a formula
+_T_PATTERN = re.compile(r"\bt\b")
+
+# Text between the operands of a composite: (a) + (b) and (a+b)
+_FORMULA_SEPARATORS = {"add": ") + (", "mul": ") · ("}
+_NAME_SEPARATORS = {"add": "+", "mul": "*"}
 
-    def __init__(self, func, name, formula, params=None):
+
+class Signal:
+    """
+    Core Signal Class
+
+    Signals are immutable: time_shift / time_scale / fold return a new view
+    that shares func, params and operands with the original.
+    """
+
+    def __init__(
+        self,
+        func,
+        name,
+        formula,
+        params=None,
+        op=None,
+        operands=(),
+        energy_antiderivative=None,
+    ):
         self.func = func
-        self.name = name
-        self._base_formula = formula
-        self.params = params or {}
+        self._name = name  # leaves only; composite names are rendered lazily
+        self._base_formula = formula  # leaves only
+        self._formula_parts = None  # base formula split at each standalone t
+        self._formula = None  # rendered formula (depends on transforms)
+        self.params = MappingProxyType(dict(params or {}))  # read-only, shared
+
+        # Closed form F(u, **params) with F' = |func(u)|² (optional)
+        self.energy_antiderivative = energy_antiderivative
+
+        # Expression graph (composites only)
+        self.op = op  # "add" | "mul"
+        self.operands = tuple(operands)
+        self._compiled = None
+        self._key = None
 
         # Transformation state
         self._time_shift = 0.0  # τ
         self._time_scale = 1.0  # a
         self._fold = False  # x(-t)
 
+    def __deepcopy__(self, memo):
+        # Immutable: a copy would be indistinguishable from the original
+        return self
+
+    @property
+    def transform(self):
+        """Transformation state as (τ, a, fold)"""
+        return (self._time_shift, self._time_scale, self._fold)
+
+    def key(self):
+        """Hashable structural key: function, params, transforms and operands"""
+        if self._key is None:
+            if self.op is not None:
+                operands = tuple(operand.key() for operand in self.operands)
+                self._key = (self.op, self.transform, operands)
+            else:
+                params = freeze(self.params)
+                self._key = (func_identity(self.func), params, self.transform)
+        return self._key
+
+    # -------- Display --------
+    @property
+    def name(self):
+        """Factory name; composites render as (a+b) / (a*b) on first access"""
+        if self._name is None:
+            self._name = self._render(lambda node, t_str: node._name, _NAME_SEPARATORS)
+        return self._name
+
     @property
     def formula(self):
-        """Dynamic formula reflecting transformations"""
-        t_str = "t"
+        """Formula with the time transforms substituted for t (memoized)"""
+        if self._formula is None:
+            self._formula = self._render(Signal._leaf_formula, _FORMULA_SEPARATORS)
+        return self._formula
 
+    def _argument(self, t_str="t"):
+        """Text of the argument x(·) sees: t_str after fold, scale and shift"""
         # Fold (inversion)
         if self._fold:
             t_str = f"-{t_str}"  # no extra parentheses if not needed
@@ -35,12 +106,57 @@ class Signal:
             sign = "-" if self._time_shift > 0 else "+"
             t_str = f"{t_str}{sign}{abs(self._time_shift)}"
 
-        # Replace standalone t in base formula
-        formula_str = re.sub(r"\bt\b", t_str, self._base_formula)
+        return t_str
 
-        return f"{formula_str}"
+    def _leaf_formula(self, t_str):
+        if self._formula_parts is None:
+            self._formula_parts = _T_PATTERN.split(self._base_formula)
+        return t_str.join(self._formula_parts)
 
+    def _render(self, leaf_text, separators):
+        """
+        Render the expression tree in one pass (no recursion, no re-copying
+        of sub-strings), so the cost is linear in the size of the result.
+        Each node's transform wraps the argument its parent passes down.
+        """
+        pieces = []
+        stack = [(self, "t")]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                pieces.append(item)
+                continue
+
+            node, t_str = item
+            t_str = node._argument(t_str)
+            if node.op is None:
+                pieces.append(leaf_text(node, t_str))
+                continue
+
+            stack.append(")")
+            for index in reversed(range(len(node.operands))):
+                stack.append((node.operands[index], t_str))
+                stack.append(separators[node.op] if index else "(")
+        return "".join(pieces)
+
+    @profiled("Signal.evaluate")
     def evaluate(self, t):
+        """Samples of the signal on t, at the precision of t (float64 by default)"""
+        if self.op is not None:
+            return self.compile()(t)
+
+        x = self.func(self.transformed_time(t), **self.params)
+        return as_precision(x, sample_dtype(t))
+
+    def transformed_time(self, t):
+        """Time samples seen by func after shift, scale and fold"""
+        if isinstance(t, LazyTimeAxis):
+            # Transform the axis metadata, then materialize once
+            t_final = t.shift(self._time_shift).scale(self._time_scale)
+            if self._fold:
+                t_final = t_final.fold()
+            return t_final.to_array()
+
         # shift
         t_shifted = t - self._time_shift
 
@@ -53,64 +169,126 @@ class Signal:
         else:
             t_final = t_scaled
 
-        return self.func(t_final, **self.params)
+        return t_final
+
+    def evaluate_chunks(self, t, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stream the evaluation over a LazyTimeAxis.
+        Yields (t_chunk, x_chunk) pairs of at most chunk_size samples.
+        """
+        for t_chunk in t.chunks(chunk_size):
+            yield t_chunk, self.evaluate(t_chunk)
+
+    def compile(self):
+        """
+        Compile the expression tree into a single-pass evaluation program.
+        Compiled once per signal (signals are immutable).
+        """
+        if self._compiled is None:
+            self._compiled = CompiledSignal(self)
+        return self._compiled
 
     # -------- Transformations --------
+    def _with_transform(self, time_shift, time_scale, fold):
+        """O(1) view with new transform state; nothing else is copied"""
+        view = Signal.__new__(Signal)
+        view.__dict__.update(self.__dict__)
+        view._time_shift = time_shift
+        view._time_scale = time_scale
+        view._fold = fold
+        view._compiled = None
+        view._key = None
+        view._formula = None
+        return view
+
     def time_shift(self, tau):
-        self._time_shift += tau
-        return self
+        return self._with_transform(
+            self._time_shift + tau, self._time_scale, self._fold
+        )
 
     def time_scale(self, a):
-        self._time_scale *= a
-        return self
+        return self._with_transform(self._time_shift, self._time_scale * a, self._fold)
 
     def fold(self):
-        self._fold = not self._fold
-        return self
+        return self._with_transform(self._time_shift, self._time_scale, not self._fold)
 
     # -------- Algebra --------
     def __add__(self, other):
         return Signal(
-            lambda t: self.evaluate(t) + other.evaluate(t),
-            name=f"({self.name}+{other.name})",
-            formula=f"({self.formula}) + ({other.formula})",
+            None,
+            name=None,
+            formula=None,
+            op="add",
+            operands=(self, other),
         )
 
     def __mul__(self, other):
         return Signal(
-            lambda t: self.evaluate(t) * other.evaluate(t),
-            name=f"({self.name}*{other.name})",
-            formula=f"({self.formula}) · ({other.formula})",
+            None,
+            name=None,
+            formula=None,
+            op="mul",
+            operands=(self, other),
         )
 
     # ---------------- Energy & Power ----------------
-    def energy(self, t):
+    def analytic_energy(self, t_start, t_end):
+        """
+        Exact E = ∫ |x(t)|² dt over [t_start, t_end], or None without a closed form.
+        With u = g·(t - τ), g = ±a:  E = (F(u_end) - F(u_start)) / g
+        """
+        if self.op is not None or self.energy_antiderivative is None:
+            return None
+
+        gain = -self._time_scale if self._fold else self._time_scale
+        if gain == 0:
+            return None
+
+        # Endpoints may be float32 samples; integrate in float64
+        u_start = gain * (float(t_start) - self._time_shift)
+        u_end = gain * (float(t_end) - self._time_shift)
+        F = self.energy_antiderivative
+        return float((F(u_end, **self.params) - F(u_start, **self.params)) / gain)
+
+    def energy(self, t, analytic=True):
         """
         Discrete approximation of signal energy:
         E = ∫ |x(t)|² dt
+        Uses the closed form over [t[0], t[-1]] when available (analytic=True).
+        A LazyTimeAxis is integrated in bounded chunks (constant memory).
+        Float32 samples are squared and summed in float64.
         """
+        if analytic:
+            E = self.analytic_energy(t[0], t[-1])
+            if E is not None:
+                return E
+
+        if isinstance(t, LazyTimeAxis):
+            return stream_energy(self, t)
         x = self.evaluate(t)
-        return np.trapezoid(np.abs(x) ** 2, t)
+        power = np.square(np.abs(x), dtype=ACCUMULATOR_DTYPE)
+        return np.trapezoid(power, np.asarray(t, dtype=ACCUMULATOR_DTYPE))
 
-    def power(self, t):
+    def power(self, t, analytic=True):
         """
         Discrete approximation of average power:
         P = lim(T→∞) (1/2T) ∫ |x(t)|² dt
         Approximated by time average.
         """
-        x = self.evaluate(t)
-        T = t[-1] - t[0]
+        T = float(t[-1]) - float(t[0])
         if T == 0:
             return 0.0
-        return (1 / T) * np.trapezoid(np.abs(x) ** 2, t)
+        return (1 / T) * self.energy(t, analytic)
 
-    def classify_signal(self, t):
-        E = self.energy(t)
+    @profiled("Signal.classify_signal")
+    def classify_signal(self, t, analytic=True):
+        E = self.energy(t, analytic)
 
-        P = self.power(t)
+        # Average power from the same integral
+        T = float(t[-1]) - float(t[0])
+        P = E / T if T != 0 else 0.0
 
         # Check if energy saturates (energy signal) vs grows linearly (power signal)
-        T = t[-1] - t[0]
         if E < 1e3 and P < 1e-3:
             return "Zero Signal", E, P
 
@@ -122,6 +300,63 @@ class Signal:
             return "Energy Signal", E, P
 
 
+# Closed-form Energy
+# F(u) with dF/du = |x(u)|², so E over [u0, u1] is F(u1) - F(u0)
+# -----------------------------------------------------------------------
+
+
+def _step_energy(u, constant=1.0):
+    return constant**2 * np.maximum(u, 0.0)
+
+
+def _ramp_energy(u):
+    return np.maximum(u, 0.0) ** 3 / 3
+
+
+def _exponential_energy(u, c=1.0, a=1.0):
+    u = np.maximum(u, 0.0)
+    if a == 0:
+        return c**2 * u
+    return c**2 * np.expm1(2 * a * u) / (2 * a)
+
+
+def _sinusoid_energy(u, amplitude=1.0, frequency=1.0, phase=0.0):
+    if frequency == 0:
+        return (amplitude * np.sin(phase)) ** 2 * u
+    w = 2 * np.pi * frequency
+    return amplitude**2 * (u / 2 - np.sin(2 * (w * u + phase)) / (4 * w))
+
+
+def _sinc_energy(u, amplitude=1.0):
+    from scipy.special import sici
+
+    # ∫ sin²(πu)/(πu)² du = (π·Si(2πu) - sin²(πu)/u) / π²
+    if u == 0:
+        return 0.0
+    si, _ = sici(2 * np.pi * u)
+    return amplitude**2 * (np.pi * si - np.sin(np.pi * u) ** 2 / u) / np.pi**2
+
+
+def _signum_energy(u):
+    return u
+
+
+def _rectangular_energy(u, start=-1.0, end=1.0, amplitude=1.0):
+    if end < start:
+        return 0.0
+    return amplitude**2 * (np.clip(u, start, end) - start)
+
+
+def _triangular_energy(u, start=0.0, end=1.0, amplitude=1.0):
+    half_width = abs(end - start) / 2
+    if half_width == 0:
+        return 0.0
+    # ∫ (1 - |v|/w)² dv from the peak, odd in v
+    v = np.clip(u - (start + end) / 2, -half_width, half_width)
+    remaining = 1 - np.abs(v) / half_width
+    return amplitude**2 * np.sign(v) * half_width / 3 * (1 - remaining**3)
+
+
 # Signal Factory Functions
 # -----------------------------------------------------------------------
 
@@ -140,6 +375,7 @@ def unit_step(constant=1.0):
         name="Unit Step",
         formula="u(t)",
         params={"constant": constant},
+        energy_antiderivative=_step_energy,
     )
 
 
@@ -148,6 +384,7 @@ def ramp():
         func=lambda t: np.where(t >= 0, t, 0.0),
         name="Ramp",
         formula="t × u(t)",
+        energy_antiderivative=_ramp_energy,
     )
 
 
@@ -156,7 +393,8 @@ def exponential(c=1.0, a=1.0):
         func=lambda t, c=c, a=a: c * np.exp(a * t) * (t >= 0),
         name="Exponential",
         formula=f"{c}e^({a}t)",
-        params={"a": a},
+        params={"c": c, "a": a},
+        energy_antiderivative=_exponential_energy,
     )
 
 
@@ -171,6 +409,7 @@ def sinusoid(amplitude=1.0, frequency=1.0, phase=0.0):
             "frequency": frequency,
             "phase": phase,
         },
+        energy_antiderivative=_sinusoid_energy,
     )
 
 
@@ -180,6 +419,7 @@ def sinc_signal(amplitude=1.0):
         name="Sinc",
         formula="sin(πt)/(πt)",
         params={"amplitude": amplitude},
+        energy_antiderivative=_sinc_energy,
     )
 
 
@@ -188,6 +428,7 @@ def signum_signal():
         func=lambda t: np.sign(t),
         name="Signum",
         formula="sgn(t)",
+        energy_antiderivative=_signum_energy,
     )
 
 
@@ -199,6 +440,7 @@ def rectangular_pulse(start=-1.0, end=1.0, amplitude=1.0):
         name="Rectangular Pulse",
         formula=f"{amplitude}·rect(t)",
         params={"start": start, "end": end, "amplitude": amplitude},
+        energy_antiderivative=_rectangular_energy,
     )
 
 
@@ -213,6 +455,7 @@ def triangular_wave(start=0.0, end=1.0, amplitude=1.0):
         name="Triangular",
         formula=f"{amplitude}·tri(t)",
         params={"start": start, "end": end, "amplitude": amplitude},
+        energy_antiderivative=_triangular_energy,
     )
 
 
@@ -0,0 +1,102 @@
+import numpy as np
+
+from src.utils.profiling import profiled
+
+SLIDING_MODES = ("same", "valid")
+
+
+def _window_bounds(n, window, mode):
+    """
+    Start (inclusive) and stop (exclusive) sample of every output window.
+    "same" centers the window like np.convolve(..., mode="same");
+    "valid" keeps only windows fully inside the signal.
+    """
+    if mode == "same":
+        offset = (window - 1) // 2
+        stop = np.arange(n) + offset + 1
+        start = stop - window
+    elif mode == "valid":
+        start = np.arange(max(n - window + 1, 0))
+        stop = start + window
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+    return np.clip(start, 0, n), np.clip(stop, 0, n)
+
+
+def sliding_sum(x, window, mode="same"):
+    """
+    Windowed sums in O(N) for any window length.
+
+    Uses one cumulative sum. The data is centered on its mean first, so the
+    running sum stays small and long windows do not lose precision to
+    cancellation; the mean is added back per window.
+    Samples outside the signal count as zero (np.convolve semantics).
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if window < 1:
+        raise ValueError("window must be at least 1 sample")
+
+    n = len(x)
+    if n == 0:
+        return np.zeros(0)
+
+    mean = x.mean()
+    cumulative = np.empty(n + 1)
+    cumulative[0] = 0.0
+    np.cumsum(x - mean, out=cumulative[1:])
+
+    start, stop = _window_bounds(n, window, mode)
+    return cumulative[stop] - cumulative[start] + mean * (stop - start)
+
+
+def sliding_mean(x, window, mode="same"):
+    """Moving average over `window` samples (edges zero-padded)"""
+    return sliding_sum(x, window, mode) / window
+
+
+@profiled()
+def sliding_power(x, window, mode="same"):
+    """Moving average of |x|² — the short-time power of a signal"""
+    return sliding_mean(np.abs(x) ** 2, window, mode)
+
+
+def sliding_rms(x, window, mode="same"):
+    """Moving root-mean-square value"""
+    return np.sqrt(np.maximum(sliding_power(x, window, mode), 0.0))
+
+
+def sliding_peak(x, window, mode="same"):
+    """
+    Moving maximum of |x| in O(N) (van Herk / Gil-Werman).
+    Running maxima inside fixed blocks of `window` samples are combined so
+    every window is answered from one suffix and one prefix maximum.
+    """
+    x = np.abs(np.asarray(x))
+    if window < 1:
+        raise ValueError("window must be at least 1 sample")
+
+    n = len(x)
+    if n == 0:
+        return np.zeros(0)
+
+    # Pad to whole blocks; |x| >= 0 so zero padding never wins a maximum
+    n_blocks = -(-n // window)
+    padded = np.zeros(n_blocks * window, dtype=x.dtype)
+    padded[:n] = x
+    blocks = padded.reshape(n_blocks, window)
+
+    # Running maxima from the left (prefix) and right (suffix) of each block
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    start, stop = _window_bounds(n, window, mode)
+    end = stop - 1
+    peak = np.maximum(suffix[start], prefix[end])
+
+    # A window inside one block is either left-aligned (clipped at t[0]) or
+    # runs to the end of the data (clipped at t[-1])
+    inside = (start // window) == (end // window)
+    aligned = start % window == 0
+    peak[inside & aligned] = prefix[end[inside & aligned]]
+    peak[inside & ~aligned] = suffix[start[inside & ~aligned]]
+    return peak
@@ -0,0 +1,171 @@
+import math
+import time
+
+import numpy as np
+
+from src.utils.precision import resolve_dtype
+from src.utils.time_axis import LazyTimeAxis
+
+# Samples per generated block
+DEFAULT_BLOCK_SIZE = 1024
+
+# Seconds between poll() calls the buffer is sized for by default
+DEFAULT_POLL_INTERVAL = 0.25
+
+
+class RingBuffer:
+    """
+    Fixed-capacity (t, x) history in two preallocated arrays.
+    Writes wrap around and overwrite the oldest samples, so memory stays at
+    `capacity` samples however long the stream runs. Times stay float64
+    (a float32 clock loses sample resolution after a few minutes); `dtype`
+    is the precision of the stored samples.
+    """
+
+    def __init__(self, capacity, dtype=None):
+        self.capacity = max(int(capacity), 1)
+        self.dtype = resolve_dtype(dtype)
+        self.t = np.zeros(self.capacity)
+        self.x = np.zeros(self.capacity, dtype=self.dtype)
+        self.total = 0  # samples ever written
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def write(self, t, x):
+        n = len(x)
+        if n > self.capacity:
+            # Only the newest `capacity` samples can survive
+            self.total += n - self.capacity
+            t, x, n = t[-self.capacity :], x[-self.capacity :], self.capacity
+
+        start = self.total % self.capacity
+        first = min(n, self.capacity - start)
+        self.t[start : start + first] = t[:first]
+        self.x[start : start + first] = x[:first]
+        self.t[: n - first] = t[first:]
+        self.x[: n - first] = x[first:]
+        self.total += n
+
+    def snapshot(self, count=None):
+        """Newest `count` buffered samples (all by default) as (t, x), oldest first"""
+        n = len(self) if count is None else min(count, len(self))
+        start = (self.total - n) % self.capacity
+        if start + n <= self.capacity:
+            return self.t[start : start + n].copy(), self.x[start : start + n].copy()
+        return (
+            np.concatenate([self.t[start:], self.t[: start + n - self.capacity]]),
+            np.concatenate([self.x[start:], self.x[: start + n - self.capacity]]),
+        )
+
+
+class SignalStream:
+    """
+    Real-time block source for any Signal.
+
+    Block k covers t0 + [k·B, (k+1)·B)·dt and is due (wall clock) once its
+    last sample's time has passed since the first poll(). Each poll()
+    evaluates every block due so far — as one LazyTimeAxis, straight into
+    the ring buffer — and never recomputes history.
+
+    The buffer holds the displayed window or one poll interval of samples,
+    whichever is longer, so polling at poll_interval never overwrites
+    unread blocks. Blocks that would still be overwritten before they could
+    be read (a poll came later than that) are skipped and counted as
+    dropped. Blocks are late when computing them took longer than the
+    real time they cover, i.e. the source cannot keep up; how often the
+    caller polls does not make blocks late.
+    """
+
+    def __init__(
+        self,
+        signal,
+        fs,
+        block_size=DEFAULT_BLOCK_SIZE,
+        window=1.0,
+        t0=0.0,
+        precision=None,
+        poll_interval=DEFAULT_POLL_INTERVAL,
+        clock=time.perf_counter,
+    ):
+        self.signal = signal
+        self.fs = float(fs)
+        self.block_size = int(block_size)
+        self.t0 = float(t0)
+        self.clock = clock
+
+        # Shown samples; the buffer also fits one poll interval plus a block
+        self.window_samples = max(round(window * self.fs), self.block_size)
+        poll_samples = math.ceil(poll_interval * self.fs) + self.block_size
+        self.buffer = RingBuffer(max(self.window_samples, poll_samples), precision)
+
+        self.started = None
+        self.next_block = 0
+        self.blocks = 0
+        self.dropped = 0
+        self.late = 0
+        self.compute_seconds = 0.0
+
+    @property
+    def block_seconds(self):
+        return self.block_size / self.fs
+
+    def block_axis(self, index, count=1):
+        """Time axis of `count` consecutive blocks starting at block `index`"""
+        return LazyTimeAxis(
+            self.t0 + index * self.block_seconds,
+            1.0 / self.fs,
+            count * self.block_size,
+        )
+
+    def poll(self):
+        """Generate every block due by now; returns the number of blocks written"""
+        now = self.clock()
+        if self.started is None:
+            self.started = now
+
+        due = int((now - self.started) / self.block_seconds)
+        pending = due - self.next_block
+        capacity_blocks = max(self.buffer.capacity // self.block_size, 1)
+        if pending > capacity_blocks:
+            self.dropped += pending - capacity_blocks
+            self.next_block += pending - capacity_blocks
+            pending = capacity_blocks
+        if pending <= 0:
+            return 0
+
+        # Evaluated on a float64 clock, stored at the buffer's precision
+        axis = self.block_axis(self.next_block, pending)
+        self.buffer.write(axis.to_array(), self.signal.evaluate(axis))
+        done = self.clock()
+
+        # Compute overrun: the blocks took longer to make than they last
+        if done - now > pending * self.block_seconds:
+            self.late += pending
+        self.compute_seconds += done - now
+        self.next_block += pending
+        self.blocks += pending
+        return pending
+
+    def resume(self):
+        """Continue after a pause without counting the pause as lag"""
+        if self.started is not None:
+            self.started = self.clock() - self.next_block * self.block_seconds
+
+    def snapshot(self):
+        """Displayed window (the newest window_samples) as (t, x)"""
+        return self.buffer.snapshot(self.window_samples)
+
+    def stats(self):
+        """Counters for display / logging"""
+        elapsed = (self.clock() - self.started) if self.started is not None else 0.0
+        return {
+            "blocks": self.blocks,
+            "dropped": self.dropped,
+            "late": self.late,
+            "samples": self.blocks * self.block_size,
+            "elapsed": elapsed,
+            "sample_rate": self.blocks * self.block_size / elapsed if elapsed else 0.0,
+            "load": self.compute_seconds / elapsed if elapsed else 0.0,
+            "buffered": len(self.buffer),
+        }
@@ -0,0 +1,197 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.core.signals import SIGNAL_REGISTRY
+from src.utils.precision import DEFAULT_PRECISION
+
+# Transform fields of a sweep job, applied in this order
+TRANSFORM_FIELDS = ("shift", "scale", "fold")
+
+DEFAULT_TIME = {
+    "t_min": -5.0,
+    "t_max": 5.0,
+    "fs": 1000.0,
+    "mode": "Continuous",
+    "precision": DEFAULT_PRECISION,
+}
+
+
+def resolve_signal_key(name):
+    """Registry key for a key or display name ("Unit Step" → "unit_step")"""
+    if name in SIGNAL_REGISTRY:
+        return name
+    normalized = name.strip().lower().replace(" ", "_")
+    for key in SIGNAL_REGISTRY:
+        if key.lower() == normalized:
+            return key
+    raise KeyError(f"Unknown signal type: {name}")
+
+
+def create_signal(signal, params=None, shift=0.0, scale=1.0, fold=False):
+    """Build a registry signal (key or display name), then shift → scale → fold"""
+    signal = SIGNAL_REGISTRY[resolve_signal_key(signal)](**(params or {}))
+    if shift != 0.0:
+        signal = signal.time_shift(shift)
+    if scale != 1.0:
+        signal = signal.time_scale(scale)
+    if fold:
+        signal = signal.fold()
+    return signal
+
+
+def _grid(values):
+    """Cartesian product of a {name: value | [values]} mapping"""
+    names = list(values)
+    axes = [v if isinstance(v, list) else [v] for v in values.values()]
+    for combo in itertools.product(*axes):
+        yield dict(zip(names, combo))
+
+
+def expand_job(job):
+    """
+    Expand one sweep job into concrete cases.
+
+    A job looks like
+        {"signal": "Sinusoidal",
+         "params": {"amplitude": 1.0, "frequency": [1, 2, 5]},
+         "transforms": {"shift": [0.0, 0.5], "fold": false},
+         "time": {"t_min": -5, "t_max": 5, "fs": 1000}}
+    where any list-valued param or transform is swept.
+    Each case is {"signal", "params", "shift", "scale", "fold"}.
+    """
+    signal = resolve_signal_key(job["signal"])
+    params = job.get("params", {})
+    transforms = job.get("transforms", {})
+    unknown = set(transforms) - set(TRANSFORM_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown transforms: {sorted(unknown)}")
+    empty = [name for name, v in {**params, **transforms}.items() if v == []]
+    if empty:
+        raise ValueError(f"{signal} job sweeps an empty list for {sorted(empty)}")
+
+    cases = []
+    for params in _grid(params):
+        for transform in _grid(transforms):
+            cases.append(
+                {
+                    "signal": signal,
+                    "params": params,
+                    "shift": float(transform.get("shift", 0.0)),
+                    "scale": float(transform.get("scale", 1.0)),
+                    "fold": bool(transform.get("fold", False)),
+                }
+            )
+    return cases
+
+
+def job_time(job, defaults=None):
+    """Time window of a job: job["time"] over the spec defaults"""
+    time = dict(DEFAULT_TIME)
+    time.update(defaults or {})
+    time.update(job.get("time", {}))
+    return time
+
+
+# Process-pool classification
+# -----------------------------------------------------------------------
+
+# Cases per work unit sent to a worker process
+DEFAULT_SWEEP_CHUNK = 32
+
+# Time axis attached from shared memory, one per worker process
+_worker_time = None
+
+
+def _attach_time(name, shape, dtype):
+    """Worker initializer: map the shared time axis once per process"""
+    global _worker_time
+    # Workers share the parent's resource tracker, which unlinks the block
+    # only when the parent does
+    shm = shared_memory.SharedMemory(name=name)
+    _worker_time = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _classify_cases(cases, t, analytic):
+    results = []
+    for case in cases:
+        label, E, P = create_signal(**case).classify_signal(t, analytic=analytic)
+        results.append((label, float(E), float(P)))
+    return results
+
+
+def _classify_chunk(cases, analytic):
+    return _classify_cases(cases, _worker_time[1], analytic)
+
+
+def results_table(cases, results):
+    """
+    Structured array with one row per case: signal, one float column per
+    parameter name (NaN where a signal lacks it), transforms and metrics.
+    """
+    param_names = sorted({name for case in cases for name in case["params"]})
+    dtype = (
+        [("signal", "U32")]
+        + [(name, "f8") for name in param_names]
+        + [
+            ("shift", "f8"),
+            ("scale", "f8"),
+            ("fold", "?"),
+            ("classification", "U16"),
+            ("energy", "f8"),
+            ("power", "f8"),
+        ]
+    )
+
+    table = np.zeros(len(cases), dtype=dtype)
+    for name in param_names:
+        table[name] = [case["params"].get(name, np.nan) for case in cases]
+    for field in ("signal", "shift", "scale", "fold"):
+        table[field] = [case[field] for case in cases]
+    for column, field in enumerate(("classification", "energy", "power")):
+        table[field] = [result[column] for result in results]
+    return table
+
+
+def classify_sweep(
+    cases, time_axis, workers=None, chunk_size=DEFAULT_SWEEP_CHUNK, analytic=True
+):
+    """
+    Classify many cases (see expand_job) over one TimeAxis in parallel.
+
+    The sampled time axis is placed in shared memory once and mapped by each
+    worker at start-up, so tasks only carry their (small) case dicts.
+    Cases are sent in chunks of `chunk_size`. workers=1 runs in-process.
+    Returns a structured array (see results_table).
+    """
+    workers = workers or os.cpu_count() or 1
+    t = time_axis.generate()
+
+    if workers == 1:
+        return results_table(cases, _classify_cases(cases, t, analytic))
+
+    shm = shared_memory.SharedMemory(create=True, size=max(t.nbytes, 1))
+    shared_t = np.ndarray(t.shape, dtype=t.dtype, buffer=shm.buf)
+    try:
+        shared_t[:] = t
+
+        chunks = [
+            cases[start : start + chunk_size]
+            for start in range(0, len(cases), chunk_size)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_time,
+            initargs=(shm.name, t.shape, t.dtype.str),
+        ) as pool:
+            parts = pool.map(_classify_chunk, chunks, [analytic] * len(chunks))
+            results = [result for part in parts for result in part]
+    finally:
+        del shared_t
+        shm.close()
+        shm.unlink()
+
+    return results_table(cases, results)
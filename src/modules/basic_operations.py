@@ -1,10 +1,12 @@
-import copy
-
 import streamlit as st
 
+from src.core.cache import cached_evaluate
 from src.core.signals import get_available_signals, get_signal_modes
 from src.ui.build_signals import build_signal_ui
+from src.ui.panels import Panel, compute_panels, timing_caption
 from src.ui.plots import plot_signal
+from src.utils.precision import DEFAULT_PRECISION
+from src.utils.profiling import stage
 from src.utils.time_axis import TimeAxis
 
 
@@ -36,7 +38,7 @@ def run_basic_operations_module():
             max_value=50000,
             value=1000,
             step=100,
-            help="Too high frequency may crash the app",
+            help="Plots are downsampled for display; every sample is still computed",
         )
 
     if t_min >= t_max:
@@ -45,8 +47,13 @@ def run_basic_operations_module():
 
     # Time Axis Generation
     # --------------------------------
-    time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs, signal_mode=signal_mode)
-    t = time.generate()
+    time = TimeAxis(
+        t_min=t_min,
+        t_max=t_max,
+        dt=1 / fs,
+        signal_mode=signal_mode,
+        precision=st.session_state.get("precision", DEFAULT_PRECISION),
+    )
 
     # Signal Construction
     # --------------------------------
@@ -65,7 +72,8 @@ def run_basic_operations_module():
 
     # Apply Transformations
     # ------------------------------
-    transformed_signal = copy.deepcopy(signal)
+    # Each transform returns a new view; `signal` itself is left untouched
+    transformed_signal = signal
 
     if shift_time != 0.0:
         transformed_signal = transformed_signal.time_shift(shift_time)
@@ -76,37 +84,48 @@ def run_basic_operations_module():
     if fold_signal:
         transformed_signal = transformed_signal.fold()
 
-    # Output
+    # Output (both panels evaluated and plotted concurrently)
     # --------------------------------
     st.markdown("-----")
-    y_original = signal.evaluate(t)
-    y_transformed = transformed_signal.evaluate(t)
+    discrete = signal_mode == "Discrete"
+
+    def panel(key, panel_signal, title):
+        return Panel(
+            key,
+            evaluate=lambda: cached_evaluate(panel_signal, time),
+            figure=lambda t, x: plot_signal(
+                t, x, title=title, discrete=discrete, autoscale=True
+            ),
+        )
+
+    (original, transformed), page_seconds = compute_panels(
+        [
+            panel("input_signal", signal, f"{signal._base_formula}"),
+            panel(
+                "transformed_signal",
+                transformed_signal,
+                f"{transformed_signal.formula}",
+            ),
+        ]
+    )
     col_left, _, col_right = st.columns([1, 0.1, 1])
 
     # Left column: Input Signal
     # ------------------------
     with col_left:
         st.text("Input Signal")
-
-        fig = plot_signal(
-            t,
-            y_original,
-            title=f"{signal._base_formula}",
-            discrete=True if signal_mode == "Discrete" else False,
-            autoscale=True,
-        )
-        st.plotly_chart(fig, use_container_width=True, key="input_signal")
+        with stage("plotly_chart"):
+            st.plotly_chart(original.figure, use_container_width=True, key=original.key)
+        st.caption(timing_caption(original))
 
     # Right column: Output Plot
     # ------------------------
     with col_right:
         st.text("Transformed Signal")
+        with stage("plotly_chart"):
+            st.plotly_chart(
+                transformed.figure, use_container_width=True, key=transformed.key
+            )
+        st.caption(timing_caption(transformed))
 
-        fig = plot_signal(
-            t,
-            y_transformed,
-            title=f"{transformed_signal.formula}",
-            discrete=True if signal_mode == "Discrete" else False,
-            autoscale=True,
-        )
-        st.plotly_chart(fig, use_container_width=True, key="transformed_signal")
+    st.caption(f"Panels computed in {page_seconds * 1e3:.1f} ms (wall clock)")
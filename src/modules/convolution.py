@@ -1,25 +1,44 @@
-import numpy as np
 import streamlit as st
 
+from src.core.cache import (
+    EVALUATION_CACHE,
+    cached_evaluate,
+    cached_time,
+    signal_key,
+    time_axis_key,
+)
+from src.core.convolution import convolve
 from src.core.signals import (
-    BASIC_SIGNALS,
     exponential,
     ramp,
     rectangular_pulse,
     sinusoid,
-    time_axis,
     triangular_wave,
     unit_impulse,
     unit_step,
 )
 from src.ui.plots import plot_signal
+from src.utils.precision import DEFAULT_PRECISION
+from src.utils.profiling import stage
+from src.utils.time_axis import TimeAxis
+
+CONVOLUTION_SIGNALS = (
+    "Rectangular",
+    "Triangular",
+    "Exponential",
+    "Sinusoidal",
+    "Unit Step",
+    "Ramp",
+    "Unit Impulse",
+)
 
 
 def generate_signal_ui(
-    t, parent_col, signal_label, signal_types, default_values=None, key_prefix="sig"
+    time, parent_col, signal_label, signal_types, default_values=None, key_prefix="sig"
 ):
     """
-    Render signal selection, parameters, and return signal & formula.
+    Render signal selection, parameters, and return samples & signal.
+    time : TimeAxis the signal is evaluated on
     parent_col : column where the widgets appear
     signal_label : str, e.g., "Input Signal 1"
     signal_types : list of signal options
@@ -66,16 +85,16 @@ def generate_signal_ui(
                     key=f"{key_prefix}_phase",
                 )
 
-            x, formula = sinusoid(t, amplitude, frequency, phase)
+            signal = sinusoid(amplitude, frequency, phase)
 
         elif signal_type == "Unit Impulse":
-            x, formula = unit_impulse(t)
+            signal = unit_impulse()
 
         elif signal_type == "Unit Step":
-            x, formula = unit_step(t)
+            signal = unit_step()
 
         elif signal_type == "Ramp":
-            x, formula = ramp(t)
+            signal = ramp()
 
         elif signal_type == "Rectangular":
             start_col, end_col, amp_col = parent_col.columns(3)
@@ -101,16 +120,16 @@ def generate_signal_ui(
                     key=f"{key_prefix}_amp",
                 )
 
-            x, formula = rectangular_pulse(t, start, end, amplitude)
+            signal = rectangular_pulse(start, end, amplitude)
 
         elif signal_type == "Exponential":
             alpha = st.number_input(
                 "Exponential alpha",
-                value=defaults.get("alpha", np.e),
+                value=defaults.get("alpha", -1.0),
                 step=0.05,
                 key=f"{key_prefix}_alpha",
             )
-            x, formula = exponential(t, alpha)
+            signal = exponential(1.0, alpha)
 
         elif signal_type == "Triangular":
             start_col, end_col, amp_col = parent_col.columns(3)
@@ -130,18 +149,20 @@ def generate_signal_ui(
                     "Amplitude", value=1.0, step=0.1, key=f"{key_prefix}_tri_amplitude"
                 )
 
-            x, formula = triangular_wave(t, start=start, end=end, amplitude=amplitude)
+            signal = triangular_wave(start=start, end=end, amplitude=amplitude)
+
+        t, x = cached_evaluate(signal, time)
+        formula = signal.formula
 
         st.markdown("<div style='margin-top:20px'></div>", unsafe_allow_html=True)
         # Plot
-        st.plotly_chart(
-            plot_signal(
-                t, x, title=formula, color="green" if "1" in signal_label else "blue"
-            ),
-            use_container_width=True,
+        fig = plot_signal(
+            t, x, title=formula, color="green" if "1" in signal_label else "blue"
         )
+        with stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True, key=f"{key_prefix}_plot")
 
-        return x, formula
+        return x, signal
 
 
 def run_convolution_module():
@@ -159,29 +180,56 @@ def run_convolution_module():
     st.markdown("----")
 
     # Time axis
-    t = time_axis(0, 1, dt=0.1)
-    dt = t[1] - t[0]
+    col_t1, col_t2, col_t3 = st.columns(3)
+    with col_t1:
+        t_min = st.number_input("Start Time", value=-2.0, step=0.1, key="conv_t_min")
+    with col_t2:
+        t_max = st.number_input("End Time", value=2.0, step=0.1, key="conv_t_max")
+    with col_t3:
+        fs = st.number_input(
+            "Sampling Frequency (Hz)",
+            min_value=1,
+            max_value=200000,
+            value=1000,
+            step=100,
+            help="Convolution switches to FFT / overlap-add for long signals",
+            key="conv_fs",
+        )
+
+    if t_min >= t_max:
+        st.warning("Start time must be less than end time.")
+        return
+
+    time = TimeAxis(
+        t_min=t_min,
+        t_max=t_max,
+        dt=1 / fs,
+        precision=st.session_state.get("precision", DEFAULT_PRECISION),
+    )
 
     col1, col2 = st.columns(2)
 
     # Input Signal 1
-    x1, _ = generate_signal_ui(
-        t, col1, "Input Signal 1", BASIC_SIGNALS, key_prefix="sig1"
+    x1, signal1 = generate_signal_ui(
+        time, col1, "Input Signal 1", CONVOLUTION_SIGNALS, key_prefix="sig1"
     )
 
     # Input Signal 2
-    x2, _ = generate_signal_ui(
-        t, col2, "Input Signal 2", BASIC_SIGNALS, key_prefix="sig2"
+    x2, signal2 = generate_signal_ui(
+        time, col2, "Input Signal 2", CONVOLUTION_SIGNALS, key_prefix="sig2"
     )
 
     st.markdown("----")
 
-    # Compute convolution
-    y = np.convolve(x1, x2, mode="full") * dt
+    # Compute convolution (cached across reruns)
+    t = cached_time(time)
+    t_y, y = EVALUATION_CACHE.get_or_compute(
+        ("convolve", signal_key(signal1), signal_key(signal2), time_axis_key(time)),
+        lambda: convolve(x1, x2, t_x=t, t_h=t),
+    )
 
     st.markdown("### Output Signal (Convoluted)")
     st.markdown("<div style='margin-top:20px'></div>", unsafe_allow_html=True)
-    st.plotly_chart(
-        plot_signal(t, y, title="y(t) = signal1 * singal2"),
-        use_container_width=True,
-    )
+    fig = plot_signal(t_y, y, title="y(t) = signal1 * signal2")
+    with stage("plotly_chart"):
+        st.plotly_chart(fig, use_container_width=True)
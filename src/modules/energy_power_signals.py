@@ -1,10 +1,19 @@
-import numpy as np
 import streamlit as st
 
 # Project Imports
+from src.core.cache import (
+    EVALUATION_CACHE,
+    cached_classify,
+    cached_evaluate,
+    signal_key,
+    time_axis_key,
+)
 from src.core.signals import get_available_signals
+from src.core.sliding import sliding_power
 from src.ui.build_signals import build_signal_ui
 from src.ui.plots import plot_signal
+from src.utils.precision import DEFAULT_PRECISION
+from src.utils.profiling import stage
 from src.utils.time_axis import TimeAxis
 
 
@@ -43,17 +52,21 @@ def run_energy_power_module():
 
     # Time Axis
     # -------------------------------------------------
-    time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs)
-    t = time.generate()
+    time = TimeAxis(
+        t_min=t_min,
+        t_max=t_max,
+        dt=1 / fs,
+        precision=st.session_state.get("precision", DEFAULT_PRECISION),
+    )
 
     # Signal Construction
     # -------------------------------------------------
     signal = build_signal_ui(signal_type)
-    x = signal.evaluate(t)
+    t, x = cached_evaluate(signal, time)
 
     # Energy & Power Computation
     # -------------------------------------------------
-    signal_type, E, P = signal.classify_signal(t)
+    signal_type, E, P = cached_classify(signal, time)
 
     # Display Section
     # -------------------------------------------------
@@ -78,13 +91,15 @@ def run_energy_power_module():
             discrete=False,
             autoscale=True,
         )
-        st.plotly_chart(fig1, width="stretch", key="energy_power_signal")
+        with stage("plotly_chart"):
+            st.plotly_chart(fig1, width="stretch", key="energy_power_signal")
 
     with col_right:
         # Sliding window power (for visualization)
         window_size = max(10, int(0.05 * len(x)))  # 5% window
-        power_time = np.convolve(
-            np.abs(x) ** 2, np.ones(window_size) / window_size, mode="same"
+        power_time = EVALUATION_CACHE.get_or_compute(
+            ("sliding_power", signal_key(signal), time_axis_key(time)),
+            lambda: sliding_power(x, window_size),
         )
 
         # Power over time
@@ -95,7 +110,8 @@ def run_energy_power_module():
             discrete=False,
             autoscale=True,
         )
-        st.plotly_chart(fig2, width="stretch", key="energy_power_plot")
+        with stage("plotly_chart"):
+            st.plotly_chart(fig2, width="stretch", key="energy_power_plot")
 
     # Educational Notes
     # -------------------------------------------------
@@ -0,0 +1,115 @@
+import streamlit as st
+
+from src.core.cache import signal_key
+from src.core.signals import get_available_signals
+from src.core.stream import DEFAULT_BLOCK_SIZE, SignalStream
+from src.ui.build_signals import build_signal_ui
+from src.ui.plots import plot_signal
+from src.utils.precision import DEFAULT_PRECISION
+
+
+def _stream_for(signal, fs, window, refresh, block_size, precision):
+    """Session stream, recreated only when the source settings change"""
+    key = (signal_key(signal), fs, window, refresh, block_size, precision)
+    if st.session_state.get("scope_stream_key") != key:
+        # The buffer must hold everything generated between two refreshes
+        st.session_state.scope_stream = SignalStream(
+            signal,
+            fs,
+            block_size=block_size,
+            window=window,
+            precision=precision,
+            poll_interval=refresh,
+        )
+        st.session_state.scope_stream_key = key
+    return st.session_state.scope_stream
+
+
+def run_oscilloscope_module():
+    st.header("Oscilloscope")
+    st.text("Live scrolling view of a signal generated block by block in real time")
+
+    # Source Settings
+    # --------------------------------
+    col0, col1, col2, col3 = st.columns(4)
+
+    with col0:
+        signal_type = st.selectbox(
+            "Select Signal", get_available_signals(), index=4, key="scope_signal"
+        )
+
+    with col1:
+        fs = st.number_input(
+            "Sampling Frequency (Hz)",
+            min_value=100,
+            max_value=200000,
+            value=50000,
+            step=1000,
+            key="scope_fs",
+        )
+
+    with col2:
+        window = st.number_input(
+            "Window (s)",
+            min_value=0.01,
+            max_value=10.0,
+            value=1.0,
+            step=0.1,
+            help="History kept in the ring buffer and shown on screen",
+            key="scope_window",
+        )
+
+    with col3:
+        refresh = st.number_input(
+            "Refresh (s)",
+            min_value=0.05,
+            max_value=2.0,
+            value=0.2,
+            step=0.05,
+            help="Only the plot below reruns at this interval",
+            key="scope_refresh",
+        )
+
+    signal = build_signal_ui(signal_type)
+    running = st.toggle("Run", value=False, key="scope_running")
+
+    stream = _stream_for(
+        signal,
+        fs,
+        window,
+        refresh,
+        DEFAULT_BLOCK_SIZE,
+        st.session_state.get("precision", DEFAULT_PRECISION),
+    )
+
+    # Paused time is not lag
+    if running and not st.session_state.get("scope_was_running"):
+        stream.resume()
+    st.session_state.scope_was_running = running
+
+    st.markdown("-----")
+
+    # Live View (fragment: reruns alone, appends only the new blocks)
+    # --------------------------------
+    @st.fragment(run_every=refresh if running else None)
+    def live_view():
+        if running:
+            stream.poll()
+        t, x = stream.snapshot()
+        stats = stream.stats()
+
+        m1, m2, m3, m4, m5 = st.columns(5)
+        m1.metric("Sample Rate", f"{stats['sample_rate']:,.0f} S/s")
+        m2.metric("Blocks", f"{stats['blocks']:,}")
+        m3.metric("Dropped", f"{stats['dropped']:,}")
+        m4.metric("Late", f"{stats['late']:,}")
+        m5.metric("Compute Load", f"{stats['load']:.1%}")
+
+        if len(t) == 0:
+            st.info("Switch on Run to start the stream.")
+            return
+
+        fig = plot_signal(t, x, title=f"{signal.formula}", autoscale=True)
+        st.plotly_chart(fig, width="stretch", key="scope_plot")
+
+    live_view()
@@ -2,9 +2,12 @@ import numpy as np
 import streamlit as st
 
 # Project Imports
+from src.core.cache import cached_evaluate
 from src.core.signals import get_available_signals, get_signal_modes
 from src.ui.build_signals import build_signal_ui
 from src.ui.plots import plot_signal
+from src.utils.precision import DEFAULT_PRECISION
+from src.utils.profiling import stage
 from src.utils.time_axis import TimeAxis
 
 
@@ -37,7 +40,7 @@ def run_signals_module():
             max_value=50000,
             value=1000,
             step=100,
-            help="Too high frequency may crash the app",
+            help="Plots are downsampled for display; every sample is still computed",
         )
 
     if t_min >= t_max:
@@ -46,16 +49,21 @@ def run_signals_module():
 
     # Time Axis Generation
     # --------------------------------
-    time = TimeAxis(t_min=t_min, t_max=t_max, dt=1 / fs, signal_mode=signal_mode)
-    t = time.generate()
+    time = TimeAxis(
+        t_min=t_min,
+        t_max=t_max,
+        dt=1 / fs,
+        signal_mode=signal_mode,
+        precision=st.session_state.get("precision", DEFAULT_PRECISION),
+    )
 
     # Signal Construction
     # --------------------------------
     signal = build_signal_ui(signal_type)
 
-    # Evaluation
+    # Evaluation (cached across reruns)
     # --------------------------------
-    y = signal.evaluate(t)
+    t, y = cached_evaluate(signal, time)
 
     st.markdown("-----")
 
@@ -117,4 +125,5 @@ def run_signals_module():
             enable_zero_line=enable_zero_line,
             show_grid=show_grid,
         )
-        st.plotly_chart(fig, use_container_width=True)
+        with stage("plotly_chart"):
+            st.plotly_chart(fig, use_container_width=True)
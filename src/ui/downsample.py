@@ -0,0 +1,124 @@
+import numpy as np
+
+# Series longer than this are downsampled before plotting (method="auto")
+DOWNSAMPLE_THRESHOLD = 10_000
+
+# Target density: points per horizontal pixel of the plot
+POINTS_PER_PIXEL = 3
+
+
+def target_points(plot_width, points_per_pixel=POINTS_PER_PIXEL):
+    """Number of points worth sending for a plot `plot_width` pixels wide"""
+    return max(int(plot_width * points_per_pixel), 4)
+
+
+def minmax_downsample(t, x, n_out):
+    """
+    Min/max envelope decimation.
+    Splits the series into n_out/2 buckets and keeps the minimum and maximum
+    sample of each (in time order), so every peak survives.
+    Returns the selected sample indices.
+    """
+    n = len(x)
+    n_buckets = max(n_out // 2, 1)
+    if n <= n_out:
+        return np.arange(n)
+
+    size = -(-n // n_buckets)  # ceil
+    n_full = n // size
+    body = np.asarray(x[: n_full * size]).reshape(n_full, size)
+
+    offsets = np.arange(n_full) * size
+    lo = offsets + np.argmin(body, axis=1)
+    hi = offsets + np.argmax(body, axis=1)
+
+    if n_full * size < n:
+        tail = np.asarray(x[n_full * size :])
+        lo = np.append(lo, n_full * size + np.argmin(tail))
+        hi = np.append(hi, n_full * size + np.argmax(tail))
+
+    # Keep both extremes in time order, plus the end points
+    first = np.minimum(lo, hi)
+    second = np.maximum(lo, hi)
+    indices = np.empty(2 * first.size + 2, dtype=np.intp)
+    indices[0] = 0
+    indices[1:-1:2] = first
+    indices[2:-1:2] = second
+    indices[-1] = n - 1
+    return np.unique(indices)
+
+
+def lttb_downsample(t, x, n_out):
+    """
+    Largest-Triangle-Three-Buckets decimation.
+    Keeps the first and last samples and, per bucket, the sample forming the
+    largest triangle with the previous pick and the next bucket's mean.
+    Returns the selected sample indices.
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    t = np.asarray(t, dtype=float)
+    x = np.asarray(x, dtype=float)
+
+    # Bucket edges over the interior samples [1, n-1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+
+        # Mean of the next bucket (the last sample for the final bucket)
+        next_start = stop
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        t_avg = t[next_start:next_stop].mean()
+        x_avg = x[next_start:next_stop].mean()
+
+        # Twice the triangle area for every candidate in the bucket
+        area = np.abs(
+            (t[a] - t_avg) * (x[start:stop] - x[a])
+            - (t[a] - t[start:stop]) * (x_avg - x[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return indices
+
+
+DOWNSAMPLERS = {
+    "minmax": minmax_downsample,
+    "lttb": lttb_downsample,
+}
+
+
+def downsample(t, x, method="auto", n_out=None, threshold=DOWNSAMPLE_THRESHOLD):
+    """
+    Reduce (t, x) for display.
+
+    method : "auto" (min/max above `threshold`), "minmax", "lttb" or None
+    n_out  : target number of points (defaults to a 1200px wide plot)
+    Returns the (possibly) reduced t and x arrays.
+    """
+    if method is None or method is False:
+        return t, x
+
+    n = len(x)
+    if method == "auto":
+        if n <= threshold:
+            return t, x
+        method = "minmax"
+
+    if method not in DOWNSAMPLERS:
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    n_out = n_out or target_points(1200)
+    if n <= n_out:
+        return t, x
+
+    indices = DOWNSAMPLERS[method](t, x, n_out)
+    return np.asarray(t)[indices], np.asarray(x)[indices]
@@ -0,0 +1,83 @@
+import asyncio
+import contextvars
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# One plot of a page: evaluate() -> (t, x), then figure(t, x) -> Plotly figure
+# (plot_signal downsamples before building the traces)
+Panel = namedtuple("Panel", ["key", "evaluate", "figure"])
+
+# Result of one panel with its stage timings in seconds
+PanelResult = namedtuple("PanelResult", ["key", "figure", "timings"])
+
+# NumPy releases the GIL in its array loops, so one thread per core overlaps
+# independent panels
+PANEL_WORKERS = min(8, os.cpu_count() or 1)
+
+# Shared across Streamlit reruns, so no threads are started per rerun.
+# On a single core threads only add overhead: panels then run in turn.
+PANEL_EXECUTOR = (
+    ThreadPoolExecutor(max_workers=PANEL_WORKERS, thread_name_prefix="panel")
+    if PANEL_WORKERS > 1
+    else None
+)
+
+
+def _run_panel(panel):
+    start = time.perf_counter()
+    t, x = panel.evaluate()
+    evaluated = time.perf_counter()
+    figure = panel.figure(t, x)
+    done = time.perf_counter()
+    timings = {
+        "evaluate": evaluated - start,
+        "figure": done - evaluated,
+        "total": done - start,
+    }
+    return PanelResult(panel.key, figure, timings)
+
+
+def compute_panels(panels, executor=PANEL_EXECUTOR):
+    """
+    Run independent panels concurrently on a thread pool.
+    Panels must not call Streamlit (st.*) themselves; render the returned
+    figures from the script thread. Returns ([PanelResult], wall seconds).
+    """
+    start = time.perf_counter()
+    if executor is None or len(panels) < 2:
+        results = [_run_panel(panel) for panel in panels]
+    else:
+        # Each panel runs in a copy of the caller's context (profiling stages)
+        contexts = [contextvars.copy_context() for _ in panels]
+        results = list(
+            executor.map(
+                lambda context, panel: context.run(_run_panel, panel), contexts, panels
+            )
+        )
+    return results, time.perf_counter() - start
+
+
+async def compute_panels_async(panels, executor=PANEL_EXECUTOR):
+    """compute_panels for asyncio callers: awaits the panels on the pool"""
+    loop = asyncio.get_running_loop()  # executor=None: asyncio's default pool
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                executor, contextvars.copy_context().run, _run_panel, panel
+            )
+            for panel in panels
+        )
+    )
+    return list(results), time.perf_counter() - start
+
+
+def timing_caption(result):
+    """One-line stage timing for display under a panel"""
+    timings = result.timings
+    return (
+        f"evaluate {timings['evaluate'] * 1e3:.1f} ms · "
+        f"figure {timings['figure'] * 1e3:.1f} ms"
+    )
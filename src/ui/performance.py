@@ -0,0 +1,43 @@
+import streamlit as st
+
+# Reruns kept per session for the JSON-lines export
+PROFILE_HISTORY = 50
+
+
+def _kilobytes(n_bytes):
+    return round(n_bytes / 1024, 1)
+
+
+def render_performance_panel(recorder):
+    """Sidebar "Performance" expander for the rerun just recorded"""
+    history = st.session_state.setdefault("profile_history", [])
+    history.append(recorder.to_json())
+    del history[:-PROFILE_HISTORY]
+
+    with st.sidebar.expander("Performance", expanded=True):
+        st.caption(f"{recorder.label}: rerun took {recorder.wall * 1e3:.1f} ms")
+        rows = [
+            {
+                "stage": "· " * total["depth"] + total["stage"],
+                "calls": total["calls"],
+                "ms": round(total["seconds"] * 1e3, 2),
+                "alloc KB": _kilobytes(total["allocated"]),
+                "peak KB": _kilobytes(total["peak"]),
+                "samples": total["samples"],
+            }
+            for total in recorder.summary()
+        ]
+        if rows:
+            st.dataframe(rows, hide_index=True)
+        else:
+            st.caption("No instrumented stage ran (cached results are not re-timed)")
+        if recorder.dropped:
+            st.caption(f"{recorder.dropped} further stage calls not kept")
+
+        st.download_button(
+            f"Export last {len(history)} reruns (JSON lines)",
+            "\n".join(history) + "\n",
+            file_name="profile.jsonl",
+            mime="application/jsonl",
+            key="profile_export",
+        )
@@ -1,76 +1,80 @@
-import plotly.graph_objects as go
+from functools import lru_cache
 
+import numpy as np
 
-def plot_signal(
-    t,
-    x,
-    title="Signal",
-    discrete=False,
-    color="blue",
-    xlim=None,  # (xmin, xmax)
-    ylim=None,  # (ymin, ymax)
-    autoscale=True,
-    padding=0.05,  # 5% padding when autoscaling
-    height=400,
-    show_grid=True,
-    enable_zero_line=False,
-):
-    fig = go.Figure()
+from src.ui.downsample import downsample as downsample_series, target_points
+from src.utils.precision import resolve_dtype
+from src.utils.profiling import profiled
 
-    # Plot Type
-    # ----------------------------
+
+def stem_coordinates(t, x, baseline=0.0):
+    """
+    Vectorized stem geometry.
+    Each sample becomes (t, baseline) → (t, x) followed by a NaN break,
+    so all stems can be drawn as a single line trace.
+    Float32 input stays float32.
+    """
+    t = np.asarray(t)
+    x = np.asarray(x)
+    dtype = np.result_type(t, x, np.float32)
+
+    xs = np.empty(3 * t.size, dtype=dtype)
+    ys = np.empty(3 * t.size, dtype=dtype)
+    xs[0::3] = t
+    xs[1::3] = t
+    xs[2::3] = np.nan
+    ys[0::3] = baseline
+    ys[1::3] = x
+    ys[2::3] = np.nan
+    return xs, ys
+
+
+# Figure Skeletons
+# -----------------------------------------------------------------------
+@lru_cache(maxsize=64)
+def figure_skeleton(discrete, color, height, show_grid, enable_zero_line):
+    """
+    Validated (layout, traces) of a plot_signal figure for one style, as
+    plain dicts with the template already resolved. Traces carry no data and
+    the axes no range; plot_signal fills those in per call. Shared between
+    calls: copy before changing.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
     if discrete:
-        # Stem plot
-        for xi, ti in zip(x, t):
-            fig.add_trace(
-                go.Scatter(
-                    x=[ti, ti],
-                    y=[0, xi],
-                    mode="lines+markers",
-                    marker=dict(color=color, size=8),
-                    line=dict(color=color, width=2),
-                    showlegend=False,
-                )
+        fig.add_trace(
+            go.Scatter(
+                mode="lines",
+                line=dict(color=color, width=2),
+                connectgaps=False,
+                hoverinfo="skip",
+                showlegend=False,
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                mode="markers",
+                marker=dict(color=color, size=8),
+                showlegend=False,
             )
+        )
     else:
         fig.add_trace(
             go.Scatter(
-                x=t,
-                y=x,
                 mode="lines",
                 name="Signal",
                 line=dict(color=color, width=2),
             )
         )
 
-    # Axis Limits
-    # ----------------------------
-    if autoscale:
-        xmin, xmax = min(t), max(t)
-        ymin, ymax = min(x), max(x)
-
-        # Padding
-        dx = (xmax - xmin) * padding
-        dy = (ymax - ymin) * padding if ymax != ymin else 1
-
-        x_range = [xmin - dx, xmax + dx]
-        y_range = [ymin - dy, ymax + dy]
-
-    else:
-        x_range = list(xlim) if xlim else None
-        y_range = list(ylim) if ylim else None
-
-    # Layout
-    # ----------------------------
     fig.update_layout(
-        title=title,
         xaxis_title="Time",
         yaxis_title="Amplitude",
         template="plotly_white",
         height=height,
         margin=dict(l=10, r=10, t=40, b=40),
         xaxis=dict(
-            range=x_range,
             showline=True,
             linewidth=1,
             showgrid=show_grid,
@@ -81,7 +85,6 @@ def plot_signal(
             zerolinewidth=1,
         ),
         yaxis=dict(
-            range=y_range,
             showline=True,
             linewidth=1,
             showgrid=show_grid,
@@ -92,5 +95,100 @@ def plot_signal(
             zerolinewidth=1,
         ),
     )
+    spec = fig.to_dict()
+    return spec["layout"], spec["data"]
+
 
-    return fig
+def _with_range(axis, axis_range):
+    return axis if axis_range is None else dict(axis, range=axis_range)
+
+
+def _figure(go, data, layout):
+    """
+    Figure without re-validating the skeleton. _validate is a private
+    go.Figure argument; should Plotly reject it, fall back to validating.
+    """
+    try:
+        return go.Figure(data=data, layout=layout, _validate=False)
+    except TypeError:
+        return go.Figure(data=data, layout=layout)
+
+
+@profiled()
+def plot_signal(
+    t,
+    x,
+    title="Signal",
+    discrete=False,
+    color="blue",
+    xlim=None,  # (xmin, xmax)
+    ylim=None,  # (ymin, ymax)
+    autoscale=True,
+    padding=0.05,  # 5% padding when autoscaling
+    height=400,
+    show_grid=True,
+    enable_zero_line=False,
+    downsample="auto",  # "auto" (off for stems) | "minmax" | "lttb" | None
+    plot_width=1200,  # pixels, sets the downsampling target
+    precision=None,  # "float32" | "float64" for the sent traces; None keeps x's
+):
+    import plotly.graph_objects as go  # deferred: only pages that plot need it
+
+    # Axis extents come from the full-resolution data
+    # ----------------------------
+    if autoscale:
+        xmin, xmax = np.min(t), np.max(t)
+        ymin, ymax = np.min(x), np.max(x)
+
+    # Downsampling (display only)
+    # ----------------------------
+    if discrete and downsample == "auto":
+        # Stems draw every sample; discrete axes are already capped at
+        # MAX_DISCRETE_POINTS, which the single-trace stem renderer handles
+        downsample = None
+    t, x = downsample_series(t, x, method=downsample, n_out=target_points(plot_width))
+
+    # NumPy arrays are sent as base64 typed arrays (bdata) rather than JSON
+    # number lists, so inputs given as lists are converted too. float32
+    # halves the payload again.
+    dtype = None if precision is None else resolve_dtype(precision)
+    t = np.asarray(t, dtype=dtype)
+    x = np.asarray(x, dtype=dtype)
+
+    # Plot Type
+    # ----------------------------
+    if discrete:
+        # Stem plot: one trace for all stems, one for all markers
+        series = [stem_coordinates(t, x), (t, x)]
+    else:
+        series = [(t, x)]
+
+    # Axis Limits
+    # ----------------------------
+    if autoscale:
+        # Padding
+        dx = (xmax - xmin) * padding
+        dy = (ymax - ymin) * padding if ymax != ymin else 1
+
+        x_range = [xmin - dx, xmax + dx]
+        y_range = [ymin - dy, ymax + dy]
+
+    else:
+        x_range = list(xlim) if xlim else None
+        y_range = list(ylim) if ylim else None
+
+    # Figure: cached skeleton + this call's data, ranges and title
+    # ----------------------------
+    layout, traces = figure_skeleton(
+        discrete, color, height, show_grid, enable_zero_line
+    )
+    return _figure(
+        go,
+        data=[dict(trace, x=xs, y=ys) for trace, (xs, ys) in zip(traces, series)],
+        layout=dict(
+            layout,
+            title={"text": title},
+            xaxis=_with_range(layout["xaxis"], x_range),
+            yaxis=_with_range(layout["yaxis"], y_range),
+        ),
+    )
@@ -0,0 +1,48 @@
+import numpy as np
+
+# Sample precisions a pipeline can run at. float64 is the analysis default;
+# float32 halves sample memory and plot payloads for on-screen work.
+PRECISIONS = {
+    "float64": np.dtype(np.float64),
+    "float32": np.dtype(np.float32),
+}
+
+DEFAULT_PRECISION = "float64"
+
+# Integrals (energy, power) always accumulate at this precision
+ACCUMULATOR_DTYPE = np.dtype(np.float64)
+
+
+def resolve_dtype(precision=None):
+    """Sample dtype for a precision name or dtype (None → default)"""
+    if precision is None:
+        precision = DEFAULT_PRECISION
+    if isinstance(precision, str):
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision: {precision} (choose from {list(PRECISIONS)})"
+            )
+        return PRECISIONS[precision]
+
+    dtype = np.dtype(precision)
+    if dtype not in PRECISIONS.values():
+        raise ValueError(f"Unsupported sample dtype: {dtype}")
+    return dtype
+
+
+def sample_dtype(t):
+    """Dtype of samples evaluated on `t`: its own float dtype, else float64"""
+    dtype = getattr(t, "dtype", None)
+    if dtype is None or not np.issubdtype(dtype, np.floating):
+        return PRECISIONS["float64"]
+    return np.dtype(dtype)
+
+
+def as_precision(x, dtype):
+    """Real samples cast to `dtype` (returned as-is when they already match)"""
+    if getattr(x, "dtype", None) == dtype:
+        return x
+    x = np.asarray(x)
+    if np.iscomplexobj(x):
+        return x
+    return x.astype(dtype, copy=False)
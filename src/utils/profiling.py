@@ -0,0 +1,199 @@
+"""
+Per-stage timing and memory instrumentation.
+
+Stages are recorded only while a Recorder is active (one per app rerun);
+otherwise stage() and @profiled cost a single context-variable lookup.
+
+    @profiled("Signal.evaluate")
+    def evaluate(self, t): ...
+
+    with stage("plotly_chart"):
+        st.plotly_chart(fig)
+
+    with Recorder("Convolution") as recorder:
+        run_page()
+    recorder.summary()
+
+Each record holds wall time, bytes still allocated at the end of the stage
+and peak bytes above the starting point (tracemalloc, which NumPy reports
+its buffers to), and the largest array size handled. Nested stages carry
+their depth; a parent's time includes its children. tracemalloc is
+process-wide, so memory figures of concurrent reruns overlap.
+"""
+
+import contextvars
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import numpy as np
+
+# When set, every rerun is recorded and appended here as one JSON line
+PROFILE_LOG_ENV = "CSVIZ_PROFILE_LOG"
+
+# Records kept per rerun (per-call stages inside loops are counted, not kept)
+MAX_RECORDS = 2000
+
+_RECORDER = contextvars.ContextVar("profiling_recorder", default=None)
+_PARENT = contextvars.ContextVar("profiling_parent", default=None)
+
+
+def array_samples(*values):
+    """Largest array length among values (one level into tuples / lists)"""
+    largest = 0
+    for value in values:
+        if isinstance(value, (tuple, list)):
+            largest = max(largest, array_samples(*value))
+        elif isinstance(value, np.ndarray):
+            largest = max(largest, value.size)
+        elif hasattr(value, "to_array"):  # LazyTimeAxis
+            largest = max(largest, len(value))
+    return largest
+
+
+class Recorder:
+    """Collects the stage records of one rerun"""
+
+    def __init__(self, label="", trace_memory=True):
+        self.label = label
+        self.trace_memory = trace_memory
+        self.records = []
+        self.dropped = 0
+        self.wall = 0.0
+        self.timestamp = None
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._token = None
+        self._start = None
+
+    def __enter__(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.timestamp = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        self._token = _RECORDER.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall = time.perf_counter() - self._start
+        _RECORDER.reset(self._token)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    def add(self, record):
+        with self._lock:
+            if len(self.records) < MAX_RECORDS:
+                self.records.append(record)
+            else:
+                self.dropped += 1
+
+    def summary(self):
+        """Records merged per (stage, depth), slowest first"""
+        merged = {}
+        for record in self.records:
+            key = (record["stage"], record["depth"])
+            total = merged.setdefault(
+                key,
+                {
+                    "stage": record["stage"],
+                    "depth": record["depth"],
+                    "calls": 0,
+                    "seconds": 0.0,
+                    "allocated": 0,
+                    "peak": 0,
+                    "samples": 0,
+                },
+            )
+            total["calls"] += 1
+            total["seconds"] += record["seconds"]
+            total["allocated"] += record.get("allocated", 0)
+            total["peak"] = max(total["peak"], record.get("peak", 0))
+            total["samples"] = max(total["samples"], record["samples"])
+        return sorted(merged.values(), key=lambda total: -total["seconds"])
+
+    def to_json(self):
+        """The rerun as one JSON line"""
+        return json.dumps(
+            {
+                "timestamp": self.timestamp,
+                "label": self.label,
+                "wall": self.wall,
+                "dropped": self.dropped,
+                "stages": self.records,
+            }
+        )
+
+    def export(self, path):
+        """Append the rerun to a JSON-lines file"""
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(self.to_json() + "\n")
+
+
+@contextmanager
+def stage(name):
+    """
+    Time the enclosed block as a stage of the active rerun.
+    Yields the record dict; set record["samples"] to report an array size.
+    """
+    recorder = _RECORDER.get()
+    if recorder is None:
+        yield {}
+        return
+
+    parent = _PARENT.get()
+    record = {
+        "stage": name,
+        "depth": 0 if parent is None else parent["depth"] + 1,
+        "thread": threading.current_thread().name,
+        "samples": 0,
+        "_peak": 0,  # absolute peak reached inside nested stages
+    }
+    token = _PARENT.set(record)
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["seconds"] = time.perf_counter() - start
+        nested_peak = record.pop("_peak")
+        if tracing and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # Nested stages reset the peak; theirs is carried up explicitly
+            peak = max(peak, nested_peak)
+            record["allocated"] = current - before
+            record["peak"] = max(peak - before, 0)
+            if parent is not None:
+                parent["_peak"] = max(parent.get("_peak", 0), peak)
+        _PARENT.reset(token)
+        recorder.add(record)
+
+
+def profiled(name=None):
+    """Decorator: record every call as a stage (named after the function)"""
+
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _RECORDER.get() is None:
+                return func(*args, **kwargs)
+            with stage(label) as record:
+                result = func(*args, **kwargs)
+                record["samples"] = array_samples(result, *args)
+            return result
+
+        return wrapper
+
+    return decorate
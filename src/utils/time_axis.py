@@ -1,27 +1,135 @@
 import numpy as np
 
+from src.utils.precision import DEFAULT_PRECISION, resolve_dtype
+from src.utils.profiling import profiled
+
+# Discrete mode draws every sample as a stem; the vectorized stem renderer
+# keeps figures responsive up to this many samples.
+MAX_DISCRETE_POINTS = 20_000
+
+# Default number of samples per chunk when streaming through a time axis
+DEFAULT_CHUNK_SIZE = 65_536
+
+
+class LazyTimeAxis:
+    """
+    Uniform time axis stored as t[i] = t0 + i·dt for 0 <= i < n.
+    Slicing and affine transforms only change (t0, dt, n); samples are
+    materialized on demand with to_array() / np.asarray().
+    (t0, dt) stay float64; `dtype` is only the precision of materialized samples.
+    """
+
+    def __init__(self, t0, dt, n, dtype=None):
+        self.t0 = float(t0)
+        self.dt = float(dt)
+        self.n = max(int(n), 0)
+        self.dtype = resolve_dtype(dtype)
+
+    def __repr__(self):
+        return (
+            f"LazyTimeAxis(t0={self.t0}, dt={self.dt}, n={self.n}, "
+            f"dtype={self.dtype.name})"
+        )
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.n)
+            count = len(range(start, stop, step))
+            return LazyTimeAxis(
+                self.t0 + start * self.dt, self.dt * step, count, self.dtype
+            )
+
+        if index < 0:
+            index += self.n
+        if not 0 <= index < self.n:
+            raise IndexError("time axis index out of range")
+        return self.t0 + index * self.dt
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_array(dtype)
+
+    def to_array(self, dtype=None):
+        """Materialize the samples (computed in float64, stored as dtype)"""
+        t = self.t0 + self.dt * np.arange(self.n)
+        return t.astype(self.dtype if dtype is None else dtype, copy=False)
+
+    # -------- Affine transforms (O(1)) --------
+    def shift(self, tau):
+        """t → t - τ"""
+        return LazyTimeAxis(self.t0 - tau, self.dt, self.n, self.dtype)
+
+    def scale(self, a):
+        """t → a·t"""
+        return LazyTimeAxis(a * self.t0, a * self.dt, self.n, self.dtype)
+
+    def fold(self):
+        """t → -t"""
+        return LazyTimeAxis(-self.t0, -self.dt, self.n, self.dtype)
+
+    # -------- Streaming --------
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield consecutive sub-axes of at most chunk_size samples"""
+        for start in range(0, self.n, chunk_size):
+            yield self[start : start + chunk_size]
+
 
 class TimeAxis:
     """Time Engine"""
 
-    def __init__(self, t_min=-5.0, t_max=5.0, dt=0.001, signal_mode="Continuous"):
+    def __init__(
+        self,
+        t_min=-5.0,
+        t_max=5.0,
+        dt=0.001,
+        signal_mode="Continuous",
+        precision=DEFAULT_PRECISION,
+    ):
         self.t_min = t_min
         self.t_max = t_max
         self.dt = dt
         self.signal_mode = signal_mode
+        self.precision = precision
+
+    @property
+    def dtype(self):
+        """Sample dtype of the precision policy ("float64" / "float32")"""
+        return resolve_dtype(self.precision)
+
+    def _discrete_points(self):
+        """Sample count in discrete mode, shared by generate() and lazy()"""
+        num_points = int((self.t_max - self.t_min) / self.dt)
+        return min(max(num_points, 10), MAX_DISCRETE_POINTS)  # clamp
 
+    @profiled("TimeAxis.generate")
     def generate(self):
+        # Samples are placed in float64, then stored at the chosen precision
+        if self.signal_mode == "Discrete":
+            t = np.linspace(self.t_min, self.t_max, self._discrete_points())
+        else:
+            t = np.arange(self.t_min, self.t_max + self.dt, self.dt)
+        return t.astype(self.dtype, copy=False)
+
+    def lazy(self):
+        """Same samples as generate(), as a LazyTimeAxis"""
         if self.signal_mode == "Discrete":
-            num_points = int((self.t_max - self.t_min) / self.dt)
-            num_points = min(max(num_points, 10), 500)  # clamp
-            return np.linspace(self.t_min, self.t_max, num_points)
+            num_points = self._discrete_points()
+            step = (self.t_max - self.t_min) / (num_points - 1)
+            return LazyTimeAxis(self.t_min, step, num_points, self.dtype)
 
-        return np.arange(self.t_min, self.t_max + self.dt, self.dt)
+        # Length and step rules of np.arange
+        num_points = int(np.ceil((self.t_max + self.dt - self.t_min) / self.dt))
+        step = (self.t_min + self.dt) - self.t_min
+        return LazyTimeAxis(self.t_min, step, num_points, self.dtype)
 
-    def update(self, t_min=None, t_max=None, dt=None):
+    def update(self, t_min=None, t_max=None, dt=None, precision=None):
         if t_min is not None:
             self.t_min = t_min
         if t_max is not None:
             self.t_max = t_max
         if dt is not None:
             self.dt = dt
+        if precision is not None:
+            self.precision = precision
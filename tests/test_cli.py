@@ -0,0 +1,32 @@
+import pytest
+
+from src.cli import run_sweep
+from src.core.sweep import expand_job
+
+
+def test_expand_job_rejects_an_empty_sweep():
+    with pytest.raises(ValueError, match="frequency"):
+        expand_job({"signal": "Sinusoidal", "params": {"frequency": []}})
+
+
+def test_run_sweep_names_the_job_with_an_empty_sweep(tmp_path):
+    spec = {
+        "jobs": [
+            {"signal": "Sinusoidal", "params": {"frequency": [1.0]}},
+            {"signal": "Sinusoidal", "transforms": {"shift": []}},
+        ]
+    }
+    with pytest.raises(ValueError, match=r"Job 1: .*shift"):
+        run_sweep(spec, tmp_path, save_samples=False, table_format="csv")
+
+
+def test_run_sweep_reports_throughput(tmp_path):
+    spec = {
+        "time": {"t_min": 0, "t_max": 1, "fs": 100},
+        "jobs": [{"signal": "Sinusoidal", "params": {"frequency": [1.0, 2.0]}}],
+    }
+    summary = run_sweep(spec, tmp_path, save_samples=False, table_format="csv")
+
+    assert summary["cases"] == 2
+    assert summary["samples"] > 0
+    assert summary["samples_per_second"] > 0
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from src.core.convolution import convolve
+
+
+def test_mismatched_small_steps_are_rejected():
+    t_x = np.arange(100) * 1e-9
+    t_h = np.arange(10) * 2e-9
+    with pytest.raises(ValueError, match="same time step"):
+        convolve(np.ones(100), np.ones(10), t_x=t_x, t_h=t_h)
+
+
+def test_matching_small_steps_scale_by_dt():
+    t = np.arange(100) * 1e-7
+    t_y, y = convolve(np.ones(100), np.ones(10), t_x=t, t_h=t[:10])
+    assert y[20] == pytest.approx(10 * 1e-7)
+    assert t_y[1] - t_y[0] == pytest.approx(1e-7)
+
+
+def test_float32_axes_with_a_short_kernel_are_accepted():
+    # Rounding t to float32 moves the kernel's step by ~1e-4 relative here
+    t = np.arange(40.0, 50.0, 1e-3).astype(np.float32)
+    _, y = convolve(np.ones(len(t), np.float32), np.ones(9, np.float32), t, t[:9])
+    assert y.dtype == np.float32
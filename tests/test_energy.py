@@ -0,0 +1,57 @@
+"""Closed-form energies against numeric integration of the same samples"""
+
+import pytest
+
+from src.core.signals import SIGNAL_REGISTRY
+from src.utils.time_axis import TimeAxis
+
+# Window and resolution of the numeric reference
+TIME_AXIS = TimeAxis(t_min=-5.0, t_max=5.0, dt=1e-4)
+
+# Trapezoid error on discontinuous signals is O(dt)
+RELATIVE_TOLERANCE = 1e-3
+ABSOLUTE_TOLERANCE = 1e-3
+
+TRANSFORMS = {
+    "none": lambda s: s,
+    "shift": lambda s: s.time_shift(0.7),
+    "scale": lambda s: s.time_scale(2.5),
+    "fold": lambda s: s.fold(),
+    "all": lambda s: s.time_shift(-0.4).time_scale(0.5).fold(),
+}
+
+FACTORY_ARGS = {
+    "unit_step": {"constant": 2.0},
+    "exponential": {"c": 1.5, "a": -0.8},
+    "Sinusoidal": {"amplitude": 2.0, "frequency": 3.0, "phase": 0.4},
+    "sinc": {"amplitude": 1.5},
+    "rectangular": {"start": -1.3, "end": 2.1, "amplitude": 2.0},
+    "triangular": {"start": -1.0, "end": 2.0, "amplitude": 3.0},
+}
+
+# Registry signals without a closed form (numeric path only)
+NUMERIC_ONLY = {"unit_impulse"}
+
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+@pytest.mark.parametrize("key", sorted(set(SIGNAL_REGISTRY) - NUMERIC_ONLY))
+def test_closed_form_matches_numeric_energy(key, transform):
+    signal = TRANSFORMS[transform](SIGNAL_REGISTRY[key](**FACTORY_ARGS.get(key, {})))
+    t = TIME_AXIS.lazy()
+
+    exact = signal.analytic_energy(t[0], t[-1])
+    assert exact is not None
+
+    numeric = signal.energy(t, analytic=False)
+    assert exact == pytest.approx(
+        numeric, rel=RELATIVE_TOLERANCE, abs=ABSOLUTE_TOLERANCE
+    )
+    assert signal.energy(t) == exact
+
+
+@pytest.mark.parametrize("key", sorted(NUMERIC_ONLY))
+def test_signals_without_closed_form_integrate_numerically(key):
+    signal = SIGNAL_REGISTRY[key]()
+    t = TIME_AXIS.lazy()
+    assert signal.analytic_energy(t[0], t[-1]) is None
+    assert signal.energy(t) == signal.energy(t, analytic=False)
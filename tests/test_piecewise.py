@@ -0,0 +1,26 @@
+import numpy as np
+
+from src.core.piecewise import piecewise_polynomial
+
+
+def test_inputs_stay_writeable():
+    breakpoints = np.array([0.0, 1.0, 2.0])
+    coefficients = np.array([[1.0, -1.0], [0.0, 1.0]])
+
+    signal = piecewise_polynomial(breakpoints, coefficients)
+
+    assert breakpoints.flags.writeable
+    assert coefficients.flags.writeable
+    assert not signal.params["breakpoints"].flags.writeable
+    assert not signal.params["coefficients"].flags.writeable
+
+
+def test_later_input_changes_do_not_reach_the_signal():
+    breakpoints = np.array([0.0, 1.0])
+    coefficients = np.array([2.0])
+    signal = piecewise_polynomial(breakpoints, coefficients)
+
+    breakpoints[1] = 5.0
+    coefficients[0] = 7.0
+
+    np.testing.assert_array_equal(signal.evaluate(np.array([0.5, 3.0])), [2.0, 0.0])
@@ -0,0 +1,63 @@
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+
+from src.ui.downsample import DOWNSAMPLE_THRESHOLD
+from src.ui.plots import plot_signal
+from src.utils.time_axis import MAX_DISCRETE_POINTS
+
+
+def test_discrete_plot_keeps_every_stem():
+    n = MAX_DISCRETE_POINTS
+    assert n > DOWNSAMPLE_THRESHOLD
+    t = np.linspace(0.0, 1.0, n)
+
+    fig = plot_signal(t, np.sin(t), discrete=True)
+
+    assert len(fig.data[1].x) == n  # markers
+    assert len(fig.data[0].x) == 3 * n  # stems
+
+
+def test_continuous_plot_is_downsampled():
+    t = np.linspace(0.0, 1.0, 2 * DOWNSAMPLE_THRESHOLD)
+    fig = plot_signal(t, np.sin(t))
+    assert len(fig.data[0].x) < len(t)
+
+
+def _validated(fig):
+    """The same figure rebuilt through Plotly's validating constructor"""
+    return go.Figure(fig.to_plotly_json())
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"discrete": True},
+        {"autoscale": False, "xlim": (-1, 1), "ylim": (-2, 2), "show_grid": False},
+    ],
+)
+def test_skeleton_figure_round_trips(options):
+    t = np.linspace(-1.0, 1.0, 50)
+    fig = plot_signal(t, np.cos(t), title="cos", **options)
+
+    spec = fig.to_plotly_json()
+    assert spec == _validated(fig).to_plotly_json()
+    assert spec["layout"]["title"]["text"] == "cos"
+    np.testing.assert_array_equal(fig.data[-1].y, np.cos(t))
+
+
+def test_figure_falls_back_when_validate_is_rejected(monkeypatch):
+    class StrictFigure(go.Figure):
+        def __init__(self, *args, **kwargs):
+            if "_validate" in kwargs:
+                raise TypeError("unexpected keyword argument '_validate'")
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(go, "Figure", StrictFigure)
+    t = np.linspace(-1.0, 1.0, 50)
+
+    fig = plot_signal(t, np.cos(t))
+
+    assert isinstance(fig, StrictFigure)
+    np.testing.assert_array_equal(fig.data[0].y, np.cos(t))
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from src.utils.time_axis import MAX_DISCRETE_POINTS, TimeAxis
+
+
+@pytest.mark.parametrize("mode", ["Continuous", "Discrete"])
+@pytest.mark.parametrize("dt", [0.001, 0.0003, 0.5])
+def test_lazy_matches_generate(mode, dt):
+    axis = TimeAxis(-5.0, 5.0, dt, signal_mode=mode)
+    t = axis.generate()
+    lazy = axis.lazy()
+
+    assert len(lazy) == len(t)
+    np.testing.assert_allclose(lazy.to_array(), t, rtol=0, atol=1e-9)
+
+
+def test_discrete_sample_count_is_clamped():
+    assert len(TimeAxis(0.0, 1.0, 0.5, signal_mode="Discrete").generate()) == 10
+    dense = TimeAxis(0.0, 100.0, 1e-4, signal_mode="Discrete")
+    assert len(dense.generate()) == len(dense.lazy()) == MAX_DISCRETE_POINTS